@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-import http.server
+import functools
 import socketserver
+import time
 from pathlib import Path
 
 import click
 from rich.console import Console
 
-from unigov.config import load_config
+from unigov.config import Config, SessionConfig, load_config
 from unigov.generator.builder import build_all, build_environment, BuildContext
-from unigov.scraper.igov import scrape_ga_session
+from unigov.generator.compress import available_encodings, precompress_site
+from unigov.generator.datastore import DataStore
+from unigov.generator.executor import ProcessExecutor, resolve_workers
+from unigov.generator.manifest import BuildManifest
+from unigov.generator.proposals_index import ProposalsIndex
+from unigov.generator.template_cache import CompiledLoader, compile_bundle
+from unigov.preview import PrecompressedHandler
+from unigov.scraper.igov import run_scrape
+from unigov.scraper.plan import BODIES, config_targets, ga_targets
+from unigov.scraper.ratelimit import RetryPolicy
+from unigov.scraper.replay import ReplayOptions, make_server, server_api_url
+from unigov.snapshot import resolve_data_dir
 
 
 console = Console()
@@ -21,6 +33,10 @@ def resolve_config_path(config_path: str | None) -> Path:
     return Path(__file__).resolve().parents[2] / "config.yaml"
 
 
+def resolve_template_root() -> Path:
+    return Path(__file__).resolve().parents[2] / "templates"
+
+
 def parse_categories(category: str | None, all_categories: bool) -> set[str]:
     if all_categories:
         return {"meetings", "agenda", "documents", "decisions", "proposals"}
@@ -29,6 +45,17 @@ def parse_categories(category: str | None, all_categories: bool) -> set[str]:
     return {"meetings", "agenda", "documents", "decisions", "proposals"}
 
 
+def resolve_sessions(config: Config, session_numbers: tuple[str, ...], all_sessions: bool) -> list[SessionConfig]:
+    if all_sessions:
+        return list(config.ga.sessions.values())
+    if not session_numbers:
+        raise click.ClickException("Pass --session, --all-sessions, --body or --all-bodies")
+    for number in session_numbers:
+        if number not in config.ga.sessions:
+            raise click.ClickException(f"Unknown session {number}")
+    return [config.ga.sessions[number] for number in dict.fromkeys(session_numbers)]
+
+
 @click.group()
 def cli() -> None:
     """UN iGov static site generator."""
@@ -36,45 +63,168 @@ def cli() -> None:
 
 @cli.command()
 @click.option("--config", "config_path", type=str, help="Path to config.yaml")
-@click.option("--session", "session_number", required=True, type=str)
+@click.option("--session", "session_numbers", multiple=True, type=str, help="Session to scrape (repeatable)")
+@click.option("--all-sessions", is_flag=True, help="Scrape every configured GA session")
+@click.option("--body", "bodies", multiple=True, type=click.Choice(BODIES), help="Scrape every session of a body (repeatable)")
+@click.option("--all-bodies", is_flag=True, help="Scrape every session of every configured body")
 @click.option("--category", type=str)
 @click.option("--all", "all_categories", is_flag=True, help="Scrape all categories")
-def scrape(config_path: str | None, session_number: str, category: str | None, all_categories: bool) -> None:
-    """Scrape GA data into nested JSON files."""
-    config = load_config(resolve_config_path(config_path))
-    if session_number not in config.ga.sessions:
-        raise click.ClickException(f"Unknown session {session_number}")
+@click.option("--concurrency", type=int, help="Maximum concurrent API requests")
+@click.option("--force", is_flag=True, help="Fetch everything, ignoring freshness policies")
+@click.option("--resume", is_flag=True, help="Skip units an interrupted run completed that are still fresh")
+@click.option("--api-url", type=str, help="iGov API root, e.g. a local 'unigov replay' server")
+def scrape(
+    config_path: str | None,
+    session_numbers: tuple[str, ...],
+    all_sessions: bool,
+    bodies: tuple[str, ...],
+    all_bodies: bool,
+    category: str | None,
+    all_categories: bool,
+    concurrency: int | None,
+    force: bool,
+    resume: bool,
+    api_url: str | None,
+) -> None:
+    """Scrape iGov data into nested JSON files.
 
-    session = config.ga.sessions[session_number]
+    All selected bodies and sessions are planned into one job list and
+    fetched over a single shared connection pool.
+    """
+    config = load_config(resolve_config_path(config_path))
     categories = parse_categories(category, all_categories)
+    selected_bodies = set(BODIES) if all_bodies else set(bodies)
 
-    console.print(f"Scraping GA session {session_number} ({session.label}) -> {sorted(categories)}")
-    scrape_ga_session(
-        data_root=config.site.data_dir,
-        session_number=session.number,
-        session_label=session.label,
-        decision_label=session.decision_label,
-        committees=config.ga.committees,
-        categories=categories,
+    targets = []
+    if session_numbers or all_sessions or not selected_bodies:
+        for session in resolve_sessions(config, session_numbers, all_sessions):
+            current = session.number == config.ga.current_session
+            targets.extend(ga_targets(session, config.ga.committees, current))
+        selected_bodies.discard("ga")
+    targets.extend(config_targets(config, selected_bodies))
+    for body, session in dict.fromkeys((target.body, target.session) for target in targets):
+        console.print(f"Scraping {body} session {session} -> {sorted(categories)}")
+
+    started = time.perf_counter()
+    stats = run_scrape(
+        config.site.data_dir,
+        targets,
+        categories,
+        force=force,
+        resume=resume,
+        freshness=config.scrape.freshness,
+        snapshots=config.scrape.snapshots,
+        concurrency=concurrency or config.scrape.concurrency,
+        rate=config.scrape.rate_limit,
+        retry_policy=RetryPolicy(attempts=config.scrape.retries),
+        base_url=api_url or config.scrape.api_url,
     )
+    elapsed = time.perf_counter() - started
+    if resume:
+        console.print(f"Resumed: {stats.resumed} units completed by the interrupted run")
+    console.print(f"Scrape complete in {elapsed:.2f}s: {stats.summary()}")
+    if stats.snapshot is not None:
+        console.print(f"Published snapshot {stats.snapshot.name}")
+    for line in stats.retry_report():
+        console.print(f"  {line}")
+    if stats.failures:
+        for path, error in sorted(stats.failures.items()):
+            console.print(f"  [red]failed[/red] {path}: {error}")
+        if config.scrape.snapshots:
+            console.print("Snapshot not published; run again with --resume to finish the staged data")
+        raise click.ClickException(f"{len(stats.failures)} endpoint(s) failed after retries")
+
+
+def parse_session_list(session_numbers: tuple[str, ...], session_list: str | None) -> tuple[str, ...]:
+    """``--session`` values followed by the comma-separated ``--sessions`` list."""
+    if session_list:
+        session_numbers += tuple(number.strip() for number in session_list.split(",") if number.strip())
+    return session_numbers
 
 
 @cli.command()
 @click.option("--config", "config_path", type=str, help="Path to config.yaml")
-@click.option("--session", "session_number", required=True, type=str)
+@click.option("--session", "session_numbers", multiple=True, type=str, help="Session to build (repeatable)")
+@click.option("--sessions", "session_list", type=str, help="Comma-separated sessions to build, e.g. 78,79,80")
+@click.option("--all-sessions", is_flag=True, help="Build every configured GA session")
 @click.option("--category", type=str)
 @click.option("--all", "all_categories", is_flag=True, help="Build all categories")
-def build(config_path: str | None, session_number: str, category: str | None, all_categories: bool) -> None:
-    """Build static HTML for GA and other bodies."""
+@click.option("--full", is_flag=True, help="Render every page, even those whose inputs are unchanged")
+@click.option("-j", "--jobs", type=int, default=1, show_default=True, help="Render processes (0 = one per CPU)")
+@click.option("--compress", is_flag=True, help="Write precompressed .gz (and .zst) siblings of text files")
+def build(
+    config_path: str | None,
+    session_numbers: tuple[str, ...],
+    session_list: str | None,
+    all_sessions: bool,
+    category: str | None,
+    all_categories: bool,
+    full: bool,
+    jobs: int,
+    compress: bool,
+) -> None:
+    """Build static HTML for GA and other bodies.
+
+    Several sessions are built in one pass sharing templates, parsed data
+    and the render pool; pages common to all sessions are built once.
+    """
     config = load_config(resolve_config_path(config_path))
-    if session_number not in config.ga.sessions:
-        raise click.ClickException(f"Unknown session {session_number}")
+    session_numbers = parse_session_list(session_numbers, session_list)
+    if not session_numbers and not all_sessions:
+        raise click.ClickException("Pass --session, --sessions or --all-sessions")
+    sessions = [session.number for session in resolve_sessions(config, session_numbers, all_sessions)]
+
+    template_root = resolve_template_root()
+    templates = build_environment(template_root, config.site.cache_dir)
+    manifest = BuildManifest(config.site.cache_dir / "build-manifest.json", config.site.output_dir, templates, force=full)
+    workers = resolve_workers(jobs)
+    executor = ProcessExecutor(template_root, workers, config.site.cache_dir) if workers > 1 else None
+    ctx = BuildContext(
+        config=config,
+        templates=templates,
+        data_dir=resolve_data_dir(config.site.data_dir),
+        data=DataStore(),
+        proposals=ProposalsIndex(config.site.cache_dir / "proposals-index.json"),
+        manifest=manifest,
+        executor=executor,
+    )
 
-    templates = build_environment(Path(__file__).resolve().parents[2] / "templates")
-    ctx = BuildContext(config=config, templates=templates)
+    started = time.perf_counter()
+    try:
+        build_all(ctx, sessions)
+    finally:
+        if executor is not None:
+            executor.close()
+    elapsed = time.perf_counter() - started
+    console.print(f"Built GA session(s) {', '.join(sessions)} in {elapsed:.2f}s with {workers} process(es): {ctx.stats.summary()}")
+    console.print(f"Data: {ctx.data.summary()}; {ctx.proposals.summary()}")
+    console.print(f"Static: {ctx.assets.summary()}")
+    if isinstance(templates.loader, CompiledLoader):
+        console.print("Templates: precompiled bundle")
+    if compress:
+        started = time.perf_counter()
+        compressed = precompress_site(config.site.output_dir, workers)
+        elapsed = time.perf_counter() - started
+        console.print(f"Compressed ({', '.join(available_encodings())}) in {elapsed:.2f}s: {compressed.summary()}")
 
-    build_all(ctx, session_number)
-    console.print(f"Built all pages for GA session {session_number}.")
+
+@cli.group()
+def templates() -> None:
+    """Manage compiled templates."""
+
+
+@templates.command("compile")
+@click.option("--config", "config_path", type=str, help="Path to config.yaml")
+def compile_templates(config_path: str | None) -> None:
+    """Precompile every template into a bundle that builds load directly.
+
+    Builds fall back to the template sources whenever they no longer
+    match the bundle, so a stale bundle is never used.
+    """
+    config = load_config(resolve_config_path(config_path))
+    template_root = resolve_template_root()
+    bundle = compile_bundle(build_environment(template_root), template_root, config.site.cache_dir)
+    console.print(f"Compiled templates into {bundle}")
 
 
 @cli.command()
@@ -82,14 +232,53 @@ def build(config_path: str | None, session_number: str, category: str | None, al
 @click.option("--session", "session_number", required=True, type=str)
 @click.option("--port", type=int, default=8000)
 def serve(config_path: str | None, session_number: str, port: int) -> None:
-    """Serve output directory for preview."""
+    """Serve output directory for preview.
+
+    Precompressed siblings from ``build --compress`` are served to clients
+    whose Accept-Encoding allows them.
+    """
     config = load_config(resolve_config_path(config_path))
     output_dir = config.site.output_dir
     if not output_dir.exists():
         raise click.ClickException("Output directory does not exist. Run build first.")
 
     console.print(f"Serving {output_dir} on http://localhost:{port}")
-    handler = http.server.SimpleHTTPRequestHandler
+    handler = functools.partial(PrecompressedHandler, directory=str(output_dir))
     with socketserver.TCPServer(("", port), handler) as httpd:
-        httpd.RequestHandlerClass.directory = str(output_dir)
         httpd.serve_forever()
+
+
+@cli.command()
+@click.option("--config", "config_path", type=str, help="Path to config.yaml")
+@click.option("--host", type=str, default="127.0.0.1")
+@click.option("--port", type=int, default=8765)
+@click.option("--latency", type=float, default=0.0, help="Seconds added before every response")
+@click.option("--bandwidth", type=float, default=0.0, help="Response throughput in KiB/s (0 = unlimited)")
+@click.option("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+@click.option("--error-status", "error_statuses", type=int, multiple=True, help="Injected status codes (repeatable)")
+def replay(
+    config_path: str | None,
+    host: str,
+    port: int,
+    latency: float,
+    bandwidth: float,
+    error_rate: float,
+    error_statuses: tuple[int, ...],
+) -> None:
+    """Serve the data/ fixtures as a local stand-in for the iGov API."""
+    config = load_config(resolve_config_path(config_path))
+    options = ReplayOptions(
+        latency=latency,
+        bandwidth=bandwidth * 1024,
+        error_rate=error_rate,
+        error_statuses=error_statuses or ReplayOptions.error_statuses,
+    )
+    server = make_server(config, host, port, options)
+    console.print(f"Replaying {resolve_data_dir(config.site.data_dir)} at {server_api_url(server)}")
+    console.print(f"Scrape against it with: unigov scrape --api-url {server_api_url(server)} ...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
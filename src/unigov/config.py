@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
@@ -20,6 +21,13 @@ class SiteConfig:
     base_url: str
     output_dir: Path
     data_dir: Path
+    # Build manifest and other state reused between builds
+    cache_dir: Path
+
+
+def latest_session(sessions: Iterable[str]) -> str:
+    """The most recent of ``sessions``, which is the only one still changing."""
+    return max(sessions, key=lambda number: int(number) if number.isdigit() else 0)
 
 
 @dataclass(frozen=True)
@@ -28,11 +36,72 @@ class GaConfig:
     sessions: dict[str, SessionConfig]
     committees: dict[str, str]
 
+    @property
+    def current_session(self) -> str:
+        return latest_session(self.sessions)
+
+
+@dataclass(frozen=True)
+class EcosocConfig:
+    body_code: str
+    label: str
+    sessions: dict[str, SessionConfig]
+    # Directory code -> name; "plenary" is the Council itself
+    bodies: dict[str, str]
+
+    @property
+    def current_session(self) -> str:
+        return latest_session(self.sessions)
+
+
+@dataclass(frozen=True)
+class ConferenceConfig:
+    code: str
+    label: str
+    session: str
+
+
+@dataclass(frozen=True)
+class ScrapeConfig:
+    concurrency: int
+    # Starting requests per second; the limiter adapts to throttling from there
+    rate_limit: float
+    retries: int
+    # iGov API root; None means the public API
+    api_url: str | None
+    # "current"/"closed" -> category (or "default") -> max age in seconds
+    freshness: dict[str, dict[str, float]]
+    # Published snapshots to keep; 0 disables snapshot staging
+    snapshots: int = 0
+
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value: str | int | float) -> float:
+    """Parse ``90``, ``"30m"``, ``"1h"`` or ``"7d"`` into seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = value.strip().lower()
+    if text and text[-1] in DURATION_UNITS:
+        return float(text[:-1]) * DURATION_UNITS[text[-1]]
+    return float(text)
+
 
 @dataclass(frozen=True)
 class Config:
     site: SiteConfig
     ga: GaConfig
+    scrape: ScrapeConfig
+    ecosoc: EcosocConfig | None = None
+    conferences: dict[str, ConferenceConfig] = field(default_factory=dict)
+
+
+def load_sessions(raw: dict) -> dict[str, SessionConfig]:
+    return {
+        str(key): SessionConfig(number=str(key), label=str(value["label"]), decision_label=value["decision_label"])
+        for key, value in raw.items()
+    }
 
 
 def load_config(path: Path) -> Config:
@@ -40,11 +109,11 @@ def load_config(path: Path) -> Config:
     base_dir = path.parent
     site = raw["site"]
     ga = raw["ga"]
+    scrape = raw.get("scrape") or {}
+    ecosoc = raw.get("ecosoc")
+    conferences = (raw.get("conferences") or {}).get("events") or {}
 
-    sessions = {
-        key: SessionConfig(number=key, label=value["label"], decision_label=value["decision_label"])
-        for key, value in ga["sessions"].items()
-    }
+    sessions = load_sessions(ga["sessions"])
 
     base_url = os.environ.get("BASE_URL") or site["base_url"]
 
@@ -54,6 +123,30 @@ def load_config(path: Path) -> Config:
             base_url=base_url,
             output_dir=base_dir / site["output_dir"],
             data_dir=base_dir / site["data_dir"],
+            cache_dir=base_dir / site.get("cache_dir", ".cache"),
         ),
         ga=GaConfig(body_code=ga["body_code"], sessions=sessions, committees=ga["committees"]),
+        ecosoc=EcosocConfig(
+            body_code=ecosoc["body_code"],
+            label=ecosoc["label"],
+            sessions=load_sessions(ecosoc["sessions"]),
+            bodies=ecosoc.get("bodies") or {},
+        )
+        if ecosoc
+        else None,
+        conferences={
+            key: ConferenceConfig(code=value.get("code", key), label=value["label"], session=str(value["session"]))
+            for key, value in conferences.items()
+        },
+        scrape=ScrapeConfig(
+            concurrency=int(scrape.get("concurrency", 8)),
+            rate_limit=float(scrape.get("rate_limit", 10)),
+            retries=int(scrape.get("retries", 4)),
+            api_url=os.environ.get("IGOV_API_URL") or scrape.get("api_url"),
+            freshness={
+                state: {category: parse_duration(ttl) for category, ttl in (policies or {}).items()}
+                for state, policies in (scrape.get("freshness") or {}).items()
+            },
+            snapshots=int(scrape.get("snapshots", 0)),
+        ),
     )
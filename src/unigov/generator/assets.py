@@ -0,0 +1,91 @@
+"""Fingerprinted static assets.
+
+Every file under ``static/`` is published as ``output/static/<dir>/<stem>.<hash><suffix>``,
+where the hash is taken from its content, and ``output/static/manifest.json``
+maps each source path to its published name. A file is only copied when no
+published file with that content exists yet, so unchanged assets keep their
+bytes and modification time, and their URLs can be cached forever.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+from jinja2 import pass_context
+
+from unigov.generator.executor import write_if_changed
+
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 10
+
+
+def fingerprinted_name(relative: Path, data: bytes) -> str:
+    """``css/un-design-system.css`` -> ``css/un-design-system.<hash>.css``."""
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return relative.with_name(f"{relative.stem}.{digest}{relative.suffix}").as_posix()
+
+
+class StaticAssets:
+    """Published names of the static assets; filled by ``sync``."""
+
+    def __init__(self) -> None:
+        # Source path relative to ``static/`` -> published path
+        self.names: dict[str, str] = {}
+        self.copied = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def sync(self, source: Path, target: Path) -> None:
+        """Publish ``source`` into ``target`` under fingerprinted names.
+
+        Files in ``target`` that the new manifest does not reference, such
+        as earlier versions of a changed asset, are deleted. Precompressed
+        siblings are left to the compression stage.
+        """
+        self.names = {}
+        for path in sorted(source.rglob("*")):
+            if not path.is_file():
+                continue
+            relative = path.relative_to(source)
+            name = fingerprinted_name(relative, path.read_bytes())
+            self.names[relative.as_posix()] = name
+            published = target / name
+            if published.exists():
+                self.unchanged += 1
+                continue
+            published.parent.mkdir(parents=True, exist_ok=True)
+            tmp = published.with_name(f".{published.name}.tmp")
+            shutil.copy2(path, tmp)
+            os.replace(tmp, published)
+            self.copied += 1
+
+        keep = set(self.names.values()) | {MANIFEST_NAME}
+        for path in sorted(target.rglob("*"), reverse=True):
+            relative = path.relative_to(target).as_posix()
+            if path.is_dir():
+                if not any(path.iterdir()):
+                    path.rmdir()
+            elif relative not in keep and not relative.endswith((".gz", ".zst")):
+                path.unlink()
+                self.removed += 1
+
+        manifest = json.dumps(dict(sorted(self.names.items())), indent=2)
+        write_if_changed(target / MANIFEST_NAME, manifest.encode("utf-8"))
+
+    def summary(self) -> str:
+        return f"{self.copied} assets copied, {self.unchanged} unchanged, {self.removed} stale removed"
+
+
+@pass_context
+def asset_url(context: Any, path: str) -> str:
+    """URL of static asset ``path`` (e.g. ``css/un-design-system.css``) under its fingerprinted name.
+
+    Pages carry the asset names in their ``assets`` context, so a page is
+    re-rendered when an asset it could reference changes.
+    """
+    assets = context.get("assets") or {}
+    return f"{context['site'].base_url}static/{assets.get(path, path)}"
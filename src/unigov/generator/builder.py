@@ -1,43 +1,112 @@
 from __future__ import annotations
 
+import hashlib
 import json
-import shutil
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-from unigov.config import Config
-from unigov.generator.renderer import render_procedure_steps, group_steps_by_segment
+from typing import Any, Callable
+
+from jinja2 import Environment, select_autoescape
+
+from unigov.config import Config, latest_session
+from unigov.generator.assets import StaticAssets, asset_url
+from unigov.generator.datastore import DataStore
+from unigov.generator.executor import PageJob, ProcessExecutor, render_job, write_if_changed
+from unigov.generator.manifest import BuildManifest, code_digest
+from unigov.generator.meetings import MeetingIndex, MeetingView, group_by_month, meeting_url
+from unigov.generator.proposals_index import ProposalsIndex
+from unigov.generator.renderer import group_steps_by_segment
+from unigov.generator.step_engine import render_procedure_steps
+from unigov.generator.template_cache import bytecode_cache, template_loader
+
+
+@dataclass
+class BuildStats:
+    # Pages whose template and context were unchanged, so not rendered
+    unchanged: int = 0
+    rendered: int = 0
+    # Rendered pages whose bytes differed from the file on disk
+    written: int = 0
+    removed: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.rendered} pages rendered ({self.written} written, {self.rendered - self.written} identical), "
+            f"{self.unchanged} unchanged inputs skipped, {self.removed} orphans removed"
+        )
 
 
 @dataclass(frozen=True)
 class BuildContext:
     config: Config
     templates: Environment
-
-
-def load_json(path: Path) -> Any:
-    if not path.exists():
-        return None
-    return json.loads(path.read_text())
+    # Data snapshot pinned for the whole build; see ``unigov.snapshot``
+    data_dir: Path
+    # Parsed data files shared by every page of the build
+    data: DataStore
+    # Proposal cross-references; refreshed by ``build_all``
+    proposals: ProposalsIndex
+    # Fingerprints from previous builds; None renders every page
+    manifest: BuildManifest | None = None
+    # Renders pages in worker processes; None renders them inline
+    executor: ProcessExecutor | None = None
+    # Fingerprinted static asset names; synced by ``build_all``
+    assets: StaticAssets = field(default_factory=StaticAssets)
+    # Meeting views per session, shared by the pages that list meetings
+    meetings: MeetingIndex = field(default_factory=MeetingIndex)
+    stats: BuildStats = field(default_factory=BuildStats)
 
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def copy_static_assets(config: Config) -> None:
-    source = config.site.output_dir.parent / "static"
-    target = config.site.output_dir / "static"
-    if target.exists():
-        shutil.rmtree(target)
-    shutil.copytree(source, target)
+def sync_static_assets(ctx: BuildContext) -> None:
+    source = ctx.config.site.output_dir.parent / "static"
+    ctx.assets.sync(source, ctx.config.site.output_dir / "static")
+
 
+def render_page(
+    ctx: BuildContext,
+    template_name: str,
+    output_dir: Path,
+    prepare: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    **context: Any,
+) -> None:
+    """Render ``template_name`` to ``output_dir/index.html``.
 
-def datetime_format(value: str, format: str = "%B %d, %Y") -> str:
+    The page is skipped when the build manifest shows its template closure
+    and context unchanged since it was last written, and the file is only
+    rewritten when its bytes change. ``prepare`` derives
+    further context from ``context`` and only runs when the page is rendered.
+    With an executor on ``ctx`` the page is queued and written on ``flush``.
+    """
+    context = {"site": ctx.config.site, "assets": ctx.assets.names, **context}
+    output = output_dir / "index.html"
+    manifest = ctx.manifest
+    fingerprint = None
+    if manifest is not None:
+        fingerprint = manifest.fingerprint(template_name, context)
+        if manifest.is_current(output, fingerprint):
+            ctx.stats.unchanged += 1
+            return
+
+    job = PageJob(template_name, output, context, prepare)
+    if ctx.executor is None:
+        ctx.stats.written += render_job(ctx.templates, job)
+    else:
+        ctx.executor.submit(job)
+    ctx.stats.rendered += 1
+
+    if manifest is not None:
+        manifest.record(output, fingerprint)
+
+
+def datetime_format(value: datetime | str, format: str = "%B %d, %Y") -> str:
+    if isinstance(value, datetime):
+        return value.strftime(format)
     try:
         dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
         return dt.strftime(format)
@@ -45,88 +114,56 @@ def datetime_format(value: str, format: str = "%B %d, %Y") -> str:
         return value
 
 
-def slugify(text: str) -> str:
-    import re
-    if not text:
-        return "meeting"
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = text.strip("-")
-    return text[:60]
+# Opens an inline footnote: "(Footnote: ..." or "(footnote: ..."
+FOOTNOTE_START = re.compile(r"\((?:[Ff]ootnote)\s*:\s*")
+PARENTHESIS = re.compile(r"[()]")
 
 
-def process_footnotes(text: str) -> tuple[str, list[str]]:
-    import re
-    if not text:
-        return "", []
+def parse_footnotes(text: str) -> tuple[str, list[str]]:
+    """Replace inline footnotes with numbered references in one left-to-right pass.
 
+    A footnote runs to its matching closing parenthesis; an unterminated
+    one ends parsing and is left as is.
+    """
+    parts: list[str] = []
     footnotes: list[str] = []
-    result = text
-
+    position = 0
     while True:
-        match = re.search(r"\((?:[Ff]ootnote)\s*:\s*", result)
+        match = FOOTNOTE_START.search(text, position)
         if not match:
             break
 
-        start = match.start()
-        open_paren = match.end() - 1
         depth = 1
-        i = open_paren + 1
-
-        while depth > 0 and i < len(result):
-            if result[i] == '(':
-                depth += 1
-            elif result[i] == ')':
-                depth -= 1
-            i += 1
-
-        if depth > 0:
+        end = None
+        for paren in PARENTHESIS.finditer(text, match.end()):
+            depth += 1 if paren.group() == "(" else -1
+            if depth == 0:
+                end = paren.end()
+                break
+        if end is None:
             break
 
-        footnote_content = result[open_paren + 1:i - 1].strip()
-        footnote_num = len(footnotes) + 1
-        footnotes.append(footnote_content)
+        footnotes.append(text[match.end():end - 1].strip())
+        number = len(footnotes)
+        parts.append(text[position:match.start()])
+        parts.append(f'<sup><a href="#fn{number}" id="fnref{number}">{number}</a></sup>')
+        position = end
+
+    parts.append(text[position:])
+    return "".join(parts), footnotes
 
-        replacement = f'<sup><a href="#fn{footnote_num}" id="fnref{footnote_num}">{footnote_num}</a></sup>'
-        result = result[:start] + replacement + result[i:]
 
-    return result, footnotes
+def process_footnotes(text: str) -> tuple[str, list[str]]:
+    if not text:
+        return "", []
+    return parse_footnotes(text)
 
 
 def get_footnotes(text: str) -> list[str]:
     """Extract footnotes from text without processing."""
-    import re
     if not text:
         return []
-
-    footnotes: list[str] = []
-    result = text
-
-    while True:
-        match = re.search(r"\((?:[Ff]ootnote)\s*:\s*", result)
-        if not match:
-            break
-
-        start = match.start()
-        open_paren = match.end() - 1
-        depth = 1
-        i = open_paren + 1
-
-        while depth > 0 and i < len(result):
-            if result[i] == '(':
-                depth += 1
-            elif result[i] == ')':
-                depth -= 1
-            i += 1
-
-        if depth > 0:
-            break
-
-        footnote_content = result[open_paren + 1:i - 1].strip()
-        footnotes.append(footnote_content)
-        result = result[i:]
-
-    return footnotes
+    return parse_footnotes(text)[1]
 
 
 def get_base_url(config: Config) -> str:
@@ -208,16 +245,23 @@ def page_breadcrumb(label: str) -> dict[str, str]:
     return {"label": label}
 
 
-def build_environment(template_root: Path) -> Environment:
+def build_environment(template_root: Path, cache_dir: Path | None = None) -> Environment:
+    """Jinja environment for ``template_root``.
+
+    With a ``cache_dir``, templates come from an up-to-date precompiled
+    bundle, or are compiled through a persistent bytecode cache.
+    """
     env = Environment(
-        loader=FileSystemLoader(str(template_root)),
+        loader=template_loader(template_root, cache_dir),
         autoescape=select_autoescape(["html"]),
+        bytecode_cache=bytecode_cache(cache_dir),
     )
     env.filters["datetime_format"] = datetime_format
     env.filters["meeting_url"] = meeting_url
     env.filters["process_footnotes"] = lambda text: process_footnotes(text)[0]
     env.globals["datetime"] = datetime
     env.globals["get_footnotes"] = get_footnotes
+    env.globals["asset_url"] = asset_url
     return env
 
 
@@ -372,122 +416,27 @@ def build_meeting_detail_breadcrumbs(
     return breadcrumbs
 
 
-def _extract_date_parts(dt_str: str) -> tuple[str, str]:
-    """Extract YYMMDD and HH from datetime string.
-
-    Handles formats like:
-    - '2025-09-09T10:00:00' (ISO format)
-    - '2026-06-04 10:00' (space separator)
-
-    Returns:
-        date_part: YYMMDD format (e.g., '250909')
-        time_part: HH format (e.g., '09')
-    """
-    if not dt_str:
-        return "000000", "00"
-
-    # Handle space-separated format: '2026-06-04 10:00'
-    if " " in dt_str:
-        date_part_raw, time_part = dt_str.split(" ")
-        parts = date_part_raw.split("-")
-        if len(parts) >= 3:
-            year = parts[0][2:]  # Get YY from YYYY
-            month = parts[1]  # MM
-            day = parts[2]  # DD
-            date_part = f"{year}{month}{day}"  # YYMMDD
-        else:
-            date_part = "000000"
-        return date_part, time_part.split(":")[0] if ":" in time_part else time_part
-
-    # Handle ISO format: '2025-09-09T10:00:00'
-    if "T" in dt_str:
-        parts = dt_str.split("T")[0].split("-")
-        if len(parts) >= 3:
-            year = parts[0][2:]
-            month = parts[1]
-            day = parts[2]
-            date_part = f"{year}{month}{day}"
-        else:
-            date_part = "000000"
-        time_part = dt_str.split("T")[1].split(":")[0]
-        return date_part, time_part
-
-    return "000000", "00"
-
-
-def meeting_url(meeting: dict) -> str:
-    """Generate flat meeting URL like '25090910-informal-meeting-on-un80-initiative'."""
-    dt_str = meeting.get("MT_dateTimeScheduleStart", "")
-    date_part, time_part = _extract_date_parts(dt_str)
-    name = slugify(meeting.get("MT_name", ""))[:50]
-    return f"{date_part}{time_part}-{name}"
-
-
-def meeting_id(meeting: dict) -> str:
-    """Generate meeting folder ID like '25090910-informal-meeting-on-un80-initiative'."""
-    return meeting_url(meeting)
-
+def prepare_meeting_steps(context: dict[str, Any]) -> dict[str, Any]:
+    rendered_steps = render_procedure_steps(context["meeting"].get("procedureStep", []))
+    return {
+        "rendered_procedure_steps": rendered_steps,
+        "steps_by_segment": group_steps_by_segment(rendered_steps),
+    }
 
-def load_proposals_map(data_dir: Path):
-    proposals_map = {}
-    resolution_map = {}
-    ga_dir = data_dir / "ga"
-    if not ga_dir.exists():
-        return proposals_map, resolution_map
 
-    for committee in ga_dir.iterdir():
-        if not committee.is_dir():
-            continue
-        for session in committee.iterdir():
-            if not session.is_dir():
-                continue
-            proposals_file = session / "proposals.json"
-            if not proposals_file.exists():
-                continue
-            proposals = load_json(proposals_file) or {}
-            for proposal in proposals.get("result", []):
-                for stage in proposal.get("PR_Stage", []):
-                    doc_symbol = stage.get("DocSymbol", "")
-                    if doc_symbol and "DR " in doc_symbol:
-                        for vote in stage.get("VotesAdd", []):
-                            psid = vote.get("PSID")
-                            if psid:
-                                if psid not in proposals_map:
-                                    proposals_map[psid] = {}
-                                proposals_map[psid]["draft_symbol"] = doc_symbol
-                                if proposal.get("PR_Title"):
-                                    proposals_map[psid]["title"] = proposal.get("PR_Title")
-                    if doc_symbol and "/" in doc_symbol:
-                        if doc_symbol.startswith("A/80/") and "DR " in doc_symbol:
-                            resolution_num = doc_symbol.split("DR ")[-1].strip()
-                            full_res = f"80/{resolution_num}"
-                            if full_res not in resolution_map:
-                                resolution_map[full_res] = doc_symbol
-    return proposals_map, resolution_map
-
-
-def build_meeting_detail(ctx: BuildContext, base_path: str, session: str, meeting_id_str: str, meeting: dict, proposals_map: dict | None = None, resolution_map: dict | None = None) -> None:
-    template = ctx.templates.get_template("meeting.html")
-
-    rendered_steps = render_procedure_steps(meeting.get("procedureStep", []))
-    steps_by_segment = group_steps_by_segment(rendered_steps)
-
-    output = template.render(
-        site=ctx.config.site,
+def build_meeting_detail(ctx: BuildContext, base_path: str, session: str, view: MeetingView, meeting: dict) -> None:
+    output_dir = ctx.config.site.output_dir / base_path / view.url
+    render_page(
+        ctx,
+        "meeting.html",
+        output_dir,
         session=session,
         meeting=meeting,
-        meeting_id=meeting_id_str,
-        proposals_map=proposals_map or {},
-        resolution_map=resolution_map or {},
-        rendered_procedure_steps=rendered_steps,
-        steps_by_segment=steps_by_segment,
-        last_build_timestamp=int(datetime.now().timestamp()),
+        view=view,
+        meeting_id=view.url,
+        prepare=prepare_meeting_steps,
     )
 
-    output_dir = ctx.config.site.output_dir / base_path / meeting_id_str
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def build_meetings_page(
     ctx: BuildContext,
@@ -496,31 +445,27 @@ def build_meetings_page(
     template_name: str = "list_meetings.html",
     parent_label: str = "General Assembly",
 ) -> None:
-    template = ctx.templates.get_template(template_name)
-    data_path = ctx.config.site.data_dir / base_path.replace("/", "/")
-    meetings = load_json(data_path / "meetings.json") or []
-    current_date = datetime.now().strftime("%Y-%m-%d")
-
-    proposals_map, resolution_map = load_proposals_map(ctx.config.site.data_dir)
+    data_path = ctx.data_dir / base_path.replace("/", "/")
+    meetings = ctx.meetings.session(ctx.data, data_path)
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir / base_path / "meetings"
+    render_page(
+        ctx,
+        template_name,
+        output_dir,
         session=session,
-        meetings=meetings,
-        current_date=current_date,
+        forthcoming_months=group_by_month(meetings.forthcoming()),
+        past_months=group_by_month(meetings.past()),
         breadcrumb_items=build_ga_breadcrumbs(session, "meetings", ctx.config),
         page_heading=f"Meetings — {session} Session",
         page_subtitle="Official meeting records and proceedings",
-        last_build_timestamp=int(datetime.now().timestamp()),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path / "meetings"
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
-    for meeting in meetings:
-        mid = meeting_id(meeting)
-        build_meeting_detail(ctx, base_path, session, mid, meeting, proposals_map, resolution_map)
+    # Meetings whose URLs collide share one folder; the last one in the file
+    # keeps it, so the page and its manifest entry do not flip between builds.
+    details = {view.url: (view, meeting) for view, meeting in zip(meetings.views, meetings.meetings)}
+    for view, meeting in details.values():
+        build_meeting_detail(ctx, base_path, session, view, meeting)
 
 
 def build_agenda_page(
@@ -530,11 +475,13 @@ def build_agenda_page(
     template_name: str = "list_table.html",
     parent_label: str = "General Assembly",
 ) -> None:
-    template = ctx.templates.get_template(template_name)
-    data_path = ctx.config.site.data_dir / base_path.replace("/", "/")
-    agenda = load_json(data_path / "agenda.json") or []
-    output = template.render(
-        site=ctx.config.site,
+    data_path = ctx.data_dir / base_path.replace("/", "/")
+    agenda = ctx.data.agenda(data_path)
+    output_dir = ctx.config.site.output_dir / base_path / "agenda"
+    render_page(
+        ctx,
+        template_name,
+        output_dir,
         session=session,
         table_type="agenda",
         items=agenda,
@@ -542,13 +489,8 @@ def build_agenda_page(
         breadcrumb_items=build_ga_breadcrumbs(session, "agenda", ctx.config),
         page_heading=f"Agenda — {session} Session",
         page_subtitle="Complete list of agenda items for the session",
-        last_build_timestamp=int(datetime.now().timestamp()),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path / "agenda"
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def build_consolidated_agenda_page(
     ctx: BuildContext,
@@ -560,26 +502,23 @@ def build_consolidated_agenda_page(
     UNGA has one agenda for the session covering all Main Committees.
     Items show with their subheadings (AG_Heading) displayed as sub-items.
     """
-    template = ctx.templates.get_template("agenda.html")
-    data_path = ctx.config.site.data_dir / "ga" / "plenary" / session
-    agenda = load_json(data_path / "agenda.json") or []
+    data_path = ctx.data_dir / "ga" / "plenary" / session
+    agenda = ctx.data.agenda(data_path)
     grouped_items = group_agenda_items(agenda)
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir / "ga" / "plenary" / session / "agenda"
+    render_page(
+        ctx,
+        "agenda.html",
+        output_dir,
         session=session,
         grouped_items=grouped_items,
         empty_message="No agenda data available yet.",
         breadcrumb_items=build_ga_breadcrumbs(session, "agenda", ctx.config),
         page_heading=f"Agenda — {session} Session",
         page_subtitle="Complete list of agenda items for the session",
-        last_build_timestamp=int(datetime.now().timestamp()),
     )
 
-    output_dir = ctx.config.site.output_dir / "ga" / "plenary" / session / "agenda"
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def build_documents_page(
     ctx: BuildContext,
@@ -588,9 +527,8 @@ def build_documents_page(
     template_name: str = "list_table.html",
     parent_label: str = "General Assembly",
 ) -> None:
-    template = ctx.templates.get_template(template_name)
-    data_path = ctx.config.site.data_dir / base_path.replace("/", "/")
-    documents = load_json(data_path / "documents.json") or []
+    data_path = ctx.data_dir / base_path.replace("/", "/")
+    documents = ctx.data.documents(data_path)
 
     flattened = []
     for item in documents:
@@ -606,8 +544,11 @@ def build_documents_page(
                 "date": doc.get("DD_officialDate"),
             })
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir / base_path / "documents"
+    render_page(
+        ctx,
+        template_name,
+        output_dir,
         session=session,
         table_type="documents",
         items=flattened,
@@ -615,12 +556,33 @@ def build_documents_page(
         breadcrumb_items=build_ga_breadcrumbs(session, "documents", ctx.config),
         page_heading=f"Documents — {session} Session",
         page_subtitle="Official documents, resolutions, and reports",
-        last_build_timestamp=int(datetime.now().timestamp()),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path / "documents"
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
+
+# ``ED_Type`` values with their own tab on the decisions page
+DECISION_CATEGORIES = {
+    "Elections and Appointments": "elections",
+    "Other Decisions": "other",
+}
+
+
+def decision_sort_key(decision: dict) -> Any:
+    # Matches Jinja's case-insensitive ``sort(attribute=...)``
+    number = decision.get("ED_DecisionNumber", "")
+    return number.lower() if isinstance(number, str) else number
+
+
+def prepare_decisions(context: dict[str, Any]) -> dict[str, Any]:
+    """Decision cards in number order, each rendered once and tagged with its tab."""
+    cards = []
+    counts = dict.fromkeys(DECISION_CATEGORIES.values(), 0)
+    for decision in sorted(context["items"], key=decision_sort_key):
+        category = DECISION_CATEGORIES.get(decision.get("ED_Type"))
+        if category is not None:
+            counts[category] += 1
+        text_html, footnotes = process_footnotes(decision.get("ED_DecisionText"))
+        cards.append({"decision": decision, "category": category, "text_html": text_html, "footnotes": footnotes})
+    return {"decision_cards": cards, "category_counts": counts}
 
 
 def build_decisions_page(
@@ -630,24 +592,22 @@ def build_decisions_page(
     template_name: str = "decisions.html",
     parent_label: str = "General Assembly",
 ) -> None:
-    template = ctx.templates.get_template(template_name)
-    data_path = ctx.config.site.data_dir / base_path.replace("/", "/")
-    decisions = load_json(data_path / "decisions.json") or []
-    output = template.render(
-        site=ctx.config.site,
+    data_path = ctx.data_dir / base_path.replace("/", "/")
+    decisions = ctx.data.decisions(data_path)
+    output_dir = ctx.config.site.output_dir / base_path / "decisions"
+    render_page(
+        ctx,
+        template_name,
+        output_dir,
         session=session,
         items=decisions,
         empty_message="No decisions data available yet.",
         breadcrumb_items=build_ga_breadcrumbs(session, "decisions", ctx.config),
         page_heading=f"Decisions — {session} Session",
         page_subtitle="Decisions adopted by the body",
-        last_build_timestamp=int(datetime.now().timestamp()),
+        prepare=prepare_decisions,
     )
 
-    output_dir = ctx.config.site.output_dir / base_path / "decisions"
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def build_proposals_page(
     ctx: BuildContext,
@@ -656,33 +616,33 @@ def build_proposals_page(
     template_name: str = "list_table.html",
     parent_label: str = "General Assembly",
 ) -> None:
-    template = ctx.templates.get_template(template_name)
-    data_path = ctx.config.site.data_dir / base_path.replace("/", "/")
-    proposals = load_json(data_path / "proposals.json") or {"result": []}
-    output = template.render(
-        site=ctx.config.site,
+    data_path = ctx.data_dir / base_path.replace("/", "/")
+    proposals = ctx.data.proposals(data_path)
+    output_dir = ctx.config.site.output_dir / base_path / "proposals"
+    render_page(
+        ctx,
+        template_name,
+        output_dir,
         session=session,
         table_type="proposals",
-        items=proposals.get("result", []),
+        items=proposals,
         empty_message="No proposals data available yet.",
         breadcrumb_items=build_ga_breadcrumbs(session, "proposals", ctx.config),
         page_heading=f"Proposals — {session} Session",
         page_subtitle="Draft resolutions and amendments",
-        last_build_timestamp=int(datetime.now().timestamp()),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path / "proposals"
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def build_ga_plenary(ctx: BuildContext, session_number: str) -> None:
     base_path = f"ga/plenary/{session_number}"
-    template = ctx.templates.get_template("session.html")
-    data_dir = ctx.config.site.data_dir / "ga" / "plenary" / session_number
+    data_dir = ctx.data_dir / "ga" / "plenary" / session_number
+    meetings = ctx.meetings.session(ctx.data, data_dir)
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir / base_path
+    render_page(
+        ctx,
+        "session.html",
+        output_dir,
         session=session_number,
         body="GA",
         body_name="General Assembly",
@@ -694,10 +654,10 @@ def build_ga_plenary(ctx: BuildContext, session_number: str) -> None:
             make_breadcrumb("General Assembly", f"{ctx.config.site.base_url}ga/plenary/{session_number}/index.html"),
             make_breadcrumb(session_number, f"{ctx.config.site.base_url}ga/plenary/{session_number}/index.html"),
         ],
-        stats=get_stats(data_dir),
-        recent_meetings=get_recent_meetings(data_dir),
-        recent_decisions=get_recent_decisions(data_dir),
-        next_meeting=get_next_meeting(data_dir),
+        stats=get_stats(ctx.data, data_dir),
+        recent_meetings=meetings.recent(),
+        recent_decisions=get_recent_decisions(ctx.data, data_dir),
+        next_meeting=meetings.next(),
         tabs=[
             {"label": "Plenary", "url": f"{ctx.config.site.base_url}ga/plenary/{session_number}/index.html", "active": True},
             {"label": "C1", "url": f"{ctx.config.site.base_url}ga/c1/{session_number}/index.html"},
@@ -706,13 +666,8 @@ def build_ga_plenary(ctx: BuildContext, session_number: str) -> None:
             {"label": "C4", "url": f"{ctx.config.site.base_url}ga/c4/{session_number}/index.html"},
             {"label": "C5", "url": f"{ctx.config.site.base_url}ga/c5/{session_number}/index.html"},
         ],
-        last_build_timestamp=int(datetime.now().timestamp()),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
     build_meetings_page(ctx, base_path, session_number, parent_label="General Assembly")
     build_consolidated_agenda_page(ctx, session_number, parent_label="General Assembly")
     build_documents_page(ctx, base_path, session_number, parent_label="General Assembly")
@@ -722,8 +677,8 @@ def build_ga_plenary(ctx: BuildContext, session_number: str) -> None:
 
 def build_ga_committee(ctx: BuildContext, committee: str, session_number: str) -> None:
     base_path = f"ga/{committee}/{session_number}"
-    template = ctx.templates.get_template("session.html")
-    data_dir = ctx.config.site.data_dir / "ga" / committee / session_number
+    data_dir = ctx.data_dir / "ga" / committee / session_number
+    meetings = ctx.meetings.session(ctx.data, data_dir)
 
     committee_info = {
         "c1": ("First Committee", "Disarmament and international security matters"),
@@ -737,8 +692,11 @@ def build_ga_committee(ctx: BuildContext, committee: str, session_number: str) -
 
     body_about = f"The {body_name} is one of the six main committees of the General Assembly. It addresses {body_description.lower()}."
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir / base_path
+    render_page(
+        ctx,
+        "session.html",
+        output_dir,
         body="GA",
         body_name=body_name,
         body_description=body_description,
@@ -746,10 +704,10 @@ def build_ga_committee(ctx: BuildContext, committee: str, session_number: str) -
         session=session_number,
         base_path=base_path,
         breadcrumb_items=build_ga_committee_breadcrumbs(committee, session_number, None, ctx.config),
-        stats=get_stats(data_dir),
-        recent_meetings=get_recent_meetings(data_dir),
-        recent_decisions=get_recent_decisions(data_dir),
-        next_meeting=get_next_meeting(data_dir),
+        stats=get_stats(ctx.data, data_dir),
+        recent_meetings=meetings.recent(),
+        recent_decisions=get_recent_decisions(ctx.data, data_dir),
+        next_meeting=meetings.next(),
         tabs=[
             {"label": "Plenary", "url": f"{ctx.config.site.base_url}ga/plenary/{session_number}/index.html"},
             {"label": "C1", "url": f"{ctx.config.site.base_url}ga/c1/{session_number}/index.html", "active": committee == "c1"},
@@ -758,21 +716,19 @@ def build_ga_committee(ctx: BuildContext, committee: str, session_number: str) -
             {"label": "C4", "url": f"{ctx.config.site.base_url}ga/c4/{session_number}/index.html", "active": committee == "c4"},
             {"label": "C5", "url": f"{ctx.config.site.base_url}ga/c5/{session_number}/index.html", "active": committee == "c5"},
         ],
-        last_build_timestamp=int(datetime.now().timestamp()),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def build_ecosoc_plenary(ctx: BuildContext, session: str) -> None:
     base_path = f"ecosoc/plenary/{session}"
-    template = ctx.templates.get_template("session.html")
-    data_dir = ctx.config.site.data_dir / "ecosoc" / "plenary" / session
+    data_dir = ctx.data_dir / "ecosoc" / "plenary" / session
+    meetings = ctx.meetings.session(ctx.data, data_dir)
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir / base_path
+    render_page(
+        ctx,
+        "session.html",
+        output_dir,
         body="ECOSOC",
         body_name="Plenary",
         body_description="The plenary is the main deliberative body of the Economic and Social Council",
@@ -780,22 +736,17 @@ def build_ecosoc_plenary(ctx: BuildContext, session: str) -> None:
         session=session,
         base_path=base_path,
         breadcrumb_items=build_ecosoc_breadcrumbs(session, None, None, ctx.config),
-        stats=get_stats(data_dir),
-        recent_meetings=get_recent_meetings(data_dir),
-        recent_decisions=get_recent_decisions(data_dir),
-        next_meeting=get_next_meeting(data_dir),
-        last_build_timestamp=int(datetime.now().timestamp()),
+        stats=get_stats(ctx.data, data_dir),
+        recent_meetings=meetings.recent(),
+        recent_decisions=get_recent_decisions(ctx.data, data_dir),
+        next_meeting=meetings.next(),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def build_ecosoc_body(ctx: BuildContext, body_code: str, session: str) -> None:
     base_path = f"ecosoc/{body_code}/{session}"
-    template = ctx.templates.get_template("session.html")
-    data_dir = ctx.config.site.data_dir / "ecosoc" / body_code / session
+    data_dir = ctx.data_dir / "ecosoc" / body_code / session
+    meetings = ctx.meetings.session(ctx.data, data_dir)
 
     body_info = {
         "hlpf": ("High-level political forum on sustainable development", "Convened under the auspices of the Council to follow up and review the implementation of the 2030 Agenda"),
@@ -805,10 +756,14 @@ def build_ecosoc_body(ctx: BuildContext, body_code: str, session: str) -> None:
         "ungegn": ("United Nations Group of Experts on Geographical Names", "Standardization of geographical names"),
     }
 
-    body_name, body_description = body_info.get(body_code, (body_code.upper(), ""))
+    bodies = ctx.config.ecosoc.bodies if ctx.config.ecosoc is not None else {}
+    body_name, body_description = body_info.get(body_code, (bodies.get(body_code, body_code.upper()), ""))
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir / base_path
+    render_page(
+        ctx,
+        "session.html",
+        output_dir,
         body="ECOSOC",
         body_name=body_name,
         body_description=body_description,
@@ -816,33 +771,32 @@ def build_ecosoc_body(ctx: BuildContext, body_code: str, session: str) -> None:
         session=session,
         base_path=base_path,
         breadcrumb_items=build_ecosoc_breadcrumbs(session, body_code, None, ctx.config),
-        stats=get_stats(data_dir),
-        recent_meetings=get_recent_meetings(data_dir),
-        recent_decisions=get_recent_decisions(data_dir),
-        next_meeting=get_next_meeting(data_dir),
-        last_build_timestamp=int(datetime.now().timestamp()),
+        stats=get_stats(ctx.data, data_dir),
+        recent_meetings=meetings.recent(),
+        recent_decisions=get_recent_decisions(ctx.data, data_dir),
+        next_meeting=meetings.next(),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def build_conference(ctx: BuildContext, code: str, session: str) -> None:
     base_path = f"conferences/{code}/{session}"
-    template = ctx.templates.get_template("session.html")
-    data_dir = ctx.config.site.data_dir / "conferences" / code / session
+    data_dir = ctx.data_dir / "conferences" / code / session
+    meetings = ctx.meetings.session(ctx.data, data_dir)
 
     conference_info = {
         "ffd4": ("Fourth International Conference on Financing for Development", "Accelerating implementation of the Addis Ababa Action Agenda", "The Fourth International Conference on Financing for Development will review the implementation of the Addis Ababa Action Agenda and address new and emerging topics."),
         "ffd4pc": ("FFD4 PrepCom", "Third preparatory committee session", "The third preparatory committee session for the Fourth International Conference on Financing for Development."),
     }
 
-    conference_name, conference_session, conference_about = conference_info.get(code, (code.upper(), session, ""))
+    configured = {event.code: event.label for event in ctx.config.conferences.values()}
+    conference_name, conference_session, conference_about = conference_info.get(code, (configured.get(code, code.upper()), session, ""))
     conference_description = f"{conference_session} Session"
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir / base_path
+    render_page(
+        ctx,
+        "session.html",
+        output_dir,
         body="Conferences",
         conference_name=conference_name,
         conference_description=f"{conference_session} Session",
@@ -853,17 +807,12 @@ def build_conference(ctx: BuildContext, code: str, session: str) -> None:
         body_about=conference_about,
         base_path=base_path,
         breadcrumb_items=build_conference_breadcrumbs(code, session, None, ctx.config),
-        stats=get_stats(data_dir),
-        recent_meetings=get_recent_meetings(data_dir),
-        recent_decisions=get_recent_decisions(data_dir),
-        next_meeting=get_next_meeting(data_dir),
-        last_build_timestamp=int(datetime.now().timestamp()),
+        stats=get_stats(ctx.data, data_dir),
+        recent_meetings=meetings.recent(),
+        recent_decisions=get_recent_decisions(ctx.data, data_dir),
+        next_meeting=meetings.next(),
     )
 
-    output_dir = ctx.config.site.output_dir / base_path
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
 
 def count_documents(items: list[dict[str, Any]]) -> int:
     total = 0
@@ -873,18 +822,18 @@ def count_documents(items: list[dict[str, Any]]) -> int:
     return total
 
 
-def get_stats(data_dir: Path) -> dict[str, int]:
-    meetings = load_json(data_dir / "meetings.json") or []
-    agenda = load_json(data_dir / "agenda.json") or []
-    documents = load_json(data_dir / "documents.json") or []
-    decisions = load_json(data_dir / "decisions.json") or []
-    proposals = load_json(data_dir / "proposals.json") or {"result": []}
+def get_stats(store: DataStore, data_dir: Path) -> dict[str, int]:
+    meetings = store.meetings(data_dir)
+    agenda = store.agenda(data_dir)
+    documents = store.documents(data_dir)
+    decisions = store.decisions(data_dir)
+    proposals = store.proposals(data_dir)
     return {
         "meetings": len(meetings),
         "agenda": len(agenda),
         "documents": count_documents(documents),
         "decisions": len(decisions),
-        "proposals": len(proposals.get("result", [])),
+        "proposals": len(proposals),
     }
 
 
@@ -947,17 +896,8 @@ def group_agenda_items(agenda: list[dict]) -> list[dict]:
     return result
 
 
-def get_recent_meetings(data_dir: Path, limit: int = 3) -> list[dict]:
-    meetings = load_json(data_dir / "meetings.json") or []
-    return sorted(
-        meetings,
-        key=lambda m: m.get("MT_dateTimeScheduleStart", ""),
-        reverse=True,
-    )[:limit]
-
-
-def get_recent_decisions(data_dir: Path, limit: int = 3) -> list[dict]:
-    decisions = load_json(data_dir / "decisions.json") or []
+def get_recent_decisions(store: DataStore, data_dir: Path, limit: int = 3) -> list[dict]:
+    decisions = store.decisions(data_dir)
 
     def decision_date(item: dict) -> str:
         meetings = item.get("ED_Meeting") or []
@@ -968,50 +908,82 @@ def get_recent_decisions(data_dir: Path, limit: int = 3) -> list[dict]:
     return sorted(decisions, key=decision_date, reverse=True)[:limit]
 
 
-def get_next_meeting(data_dir: Path) -> dict | None:
-    meetings = load_json(data_dir / "meetings.json") or []
-    today = datetime.now().strftime("%Y-%m-%d")
-    upcoming = [m for m in meetings if m.get("MT_dateTimeScheduleStart", "")[:10] > today]
-    if upcoming:
-        return sorted(upcoming, key=lambda m: m["MT_dateTimeScheduleStart"])[0]
-    return None
-
-
-def get_upcoming_meetings(data_dir: Path, limit: int = 6) -> list[dict]:
-    meetings = load_json(data_dir / "meetings.json") or []
-    today = datetime.now().strftime("%Y-%m-%d")
-    upcoming = [m for m in meetings if m.get("MT_dateTimeScheduleStart", "")[:10] >= today]
-    return sorted(upcoming, key=lambda m: m.get("MT_dateTimeScheduleStart", ""))[:limit]
-
-
 def build_home(ctx: BuildContext, session_number: str) -> None:
-    template = ctx.templates.get_template("index.html")
-    data_dir = ctx.config.site.data_dir / "ga" / "plenary" / session_number
+    data_dir = ctx.data_dir / "ga" / "plenary" / session_number
+    meetings = ctx.meetings.session(ctx.data, data_dir)
     ga_session_path = f"ga/plenary/{session_number}"
 
-    output = template.render(
-        site=ctx.config.site,
+    output_dir = ctx.config.site.output_dir
+    render_page(
+        ctx,
+        "index.html",
+        output_dir,
         ga_session_path=ga_session_path,
-        upcoming_meetings=get_upcoming_meetings(data_dir),
-        recent_decisions=get_recent_decisions(data_dir),
-        next_meeting=get_next_meeting(data_dir),
-        today=datetime.now().strftime("%Y-%m-%d"),
-        last_build_timestamp=int(datetime.now().timestamp()),
+        upcoming_meetings=meetings.upcoming(),
+        recent_decisions=get_recent_decisions(ctx.data, data_dir),
+        next_meeting=meetings.next(),
+        today=meetings.today,
     )
 
-    output_dir = ctx.config.site.output_dir
-    ensure_dir(output_dir)
-    (output_dir / "index.html").write_text(output, encoding="utf-8")
-
-
-def build_all(ctx: BuildContext, session_number: str) -> None:
-    build_home(ctx, session_number)
-    build_ga_plenary(ctx, session_number)
-    for committee in ["c1", "c2", "c3", "c4", "c5"]:
-        build_ga_committee(ctx, committee, session_number)
-    build_ecosoc_plenary(ctx, "2026")
-    for body in ["hlpf", "csw", "ggim", "unff", "ungegn"]:
-        build_ecosoc_body(ctx, body, "2025")
-    build_conference(ctx, "ffd4", "2025")
-    build_conference(ctx, "ffd4pc", "3")
-    copy_static_assets(ctx.config)
+
+def data_digest(data_dir: Path) -> str:
+    """Hash of every data file, excluding scraper state and other snapshots."""
+    digest = hashlib.sha256()
+    for path in sorted(data_dir.rglob("*.json")):
+        relative = path.relative_to(data_dir)
+        if relative.parts[0].startswith(".") or relative.parts[0] == "snapshots":
+            continue
+        digest.update(relative.as_posix().encode("utf-8"))
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def write_build_info(ctx: BuildContext) -> None:
+    """Record digests of the data and of the generator code in ``build-info.json``.
+
+    The file holds no timestamp, session list or page count, so the same
+    data built by the same code gives the same bytes whatever the flags.
+    """
+    info = {
+        "data": data_digest(ctx.data_dir),
+        "code": code_digest(),
+    }
+    write_if_changed(ctx.config.site.output_dir / "build-info.json", json.dumps(info, indent=2).encode("utf-8"))
+
+
+def build_other_bodies(ctx: BuildContext) -> None:
+    """Every configured ECOSOC session and body, and every conference, as the scraper fetches them."""
+    ecosoc = ctx.config.ecosoc
+    if ecosoc is not None:
+        for session in ecosoc.sessions:
+            for body_code in ecosoc.bodies:
+                if body_code == "plenary":
+                    build_ecosoc_plenary(ctx, session)
+                else:
+                    build_ecosoc_body(ctx, body_code, session)
+    for event in ctx.config.conferences.values():
+        build_conference(ctx, event.code, event.session)
+
+
+def build_all(ctx: BuildContext, session_numbers: list[str]) -> None:
+    """Build the GA pages of every session in ``session_numbers`` and the shared pages.
+
+    All sessions share one template environment, data store, proposals
+    index and render queue; the home page, the other bodies and the static
+    assets are produced once, with the home page showing the latest session.
+    """
+    ctx.proposals.refresh(ctx.data_dir, ctx.data)
+    sync_static_assets(ctx)
+    build_home(ctx, latest_session(session_numbers))
+    for session_number in session_numbers:
+        build_ga_plenary(ctx, session_number)
+        for committee in ["c1", "c2", "c3", "c4", "c5"]:
+            build_ga_committee(ctx, committee, session_number)
+    build_other_bodies(ctx)
+    if ctx.executor is not None:
+        ctx.stats.written += ctx.executor.flush()
+    ctx.proposals.save()
+    if ctx.manifest is not None:
+        ctx.stats.removed += len(ctx.manifest.remove_orphans())
+        ctx.manifest.save()
+    write_build_info(ctx)
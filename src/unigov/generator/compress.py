@@ -0,0 +1,124 @@
+"""Precompressed siblings of the generated site.
+
+After a build, every compressible file larger than ``MIN_SIZE`` gets a
+``.gz`` sibling, plus a ``.zst`` sibling when a zstd implementation is
+importable (``compression.zstd`` on Python 3.14+, or the ``zstandard``
+package). Each sibling carries its source's modification time, so files
+the build left untouched are not compressed again.
+"""
+from __future__ import annotations
+
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+COMPRESSIBLE_SUFFIXES = frozenset({".html", ".css", ".js", ".json", ".svg", ".txt", ".xml"})
+# Below this size the encoding overhead outweighs the savings
+MIN_SIZE = 1024
+GZIP_LEVEL = 9
+ZSTD_LEVEL = 19
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output byte-identical across builds
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _zstd_compressor() -> Callable[[bytes], bytes] | None:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return lambda data: zstd.compress(data, level=ZSTD_LEVEL)
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress
+
+
+def available_encodings() -> dict[str, Callable[[bytes], bytes]]:
+    """Content-Encoding name to compressor, in order of preference."""
+    encodings: dict[str, Callable[[bytes], bytes]] = {}
+    zstd = _zstd_compressor()
+    if zstd is not None:
+        encodings["zstd"] = zstd
+    encodings["gzip"] = _gzip
+    return encodings
+
+
+# Content-Encoding name to the suffix of the precompressed sibling
+ENCODING_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+
+@dataclass
+class CompressStats:
+    written: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.written} compressed files written, {self.unchanged} unchanged, "
+            f"{self.removed} stale removed"
+        )
+
+
+def sibling(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+
+
+def compress_file(path: Path, encodings: dict[str, Callable[[bytes], bytes]]) -> tuple[int, int]:
+    """Refresh the compressed siblings of ``path``; returns (written, unchanged)."""
+    stat = path.stat()
+    written = unchanged = 0
+    data: bytes | None = None
+    for encoding, compress in encodings.items():
+        target = sibling(path, encoding)
+        try:
+            if target.stat().st_mtime_ns == stat.st_mtime_ns:
+                unchanged += 1
+                continue
+        except FileNotFoundError:
+            pass
+        if data is None:
+            data = path.read_bytes()
+        tmp = target.with_name(f".{target.name}.tmp")
+        tmp.write_bytes(compress(data))
+        os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp, target)
+        written += 1
+    return written, unchanged
+
+
+def precompress_site(output_dir: Path, workers: int) -> CompressStats:
+    """Write compressed siblings for ``output_dir`` on ``workers`` threads.
+
+    zlib and zstd release the GIL while compressing, so threads scale
+    without pickling file contents to worker processes. Siblings whose
+    source no longer exists are deleted.
+    """
+    encodings = available_encodings()
+    stats = CompressStats()
+    sources: list[Path] = []
+    suffixes = set(ENCODING_SUFFIXES.values())
+    for path in sorted(output_dir.rglob("*")):
+        if not path.is_file():
+            continue
+        if path.suffix in suffixes:
+            source = path.with_suffix("")
+            if not source.exists() or source.stat().st_size < MIN_SIZE:
+                path.unlink()
+                stats.removed += 1
+        elif path.suffix in COMPRESSIBLE_SUFFIXES and path.stat().st_size >= MIN_SIZE:
+            sources.append(path)
+
+    with ThreadPoolExecutor(max(1, workers)) as pool:
+        for written, unchanged in pool.map(lambda path: compress_file(path, encodings), sources):
+            stats.written += written
+            stats.unchanged += unchanged
+    return stats
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+class DataStore:
+    """Data files parsed at most once per build.
+
+    Parsed payloads are keyed by path and modification time, so a file that
+    changes mid-build is read again. Callers share the returned objects and
+    must not mutate them.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[int, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.missing = 0
+
+    def load(self, path: Path) -> Any:
+        """Parsed JSON of ``path``, or None if it does not exist."""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.missing += 1
+            return None
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        payload = json.loads(path.read_text())
+        self._entries[path] = (mtime, payload)
+        return payload
+
+    def meetings(self, data_dir: Path) -> list[dict]:
+        return self.load(data_dir / "meetings.json") or []
+
+    def agenda(self, data_dir: Path) -> list[dict]:
+        return self.load(data_dir / "agenda.json") or []
+
+    def documents(self, data_dir: Path) -> list[dict]:
+        return self.load(data_dir / "documents.json") or []
+
+    def decisions(self, data_dir: Path) -> list[dict]:
+        return self.load(data_dir / "decisions.json") or []
+
+    def proposals(self, data_dir: Path) -> list[dict]:
+        """Records of the ``{"result": [...]}`` proposals envelope."""
+        payload = self.load(data_dir / "proposals.json") or {}
+        return payload.get("result", [])
+
+    def summary(self) -> str:
+        return f"{self.misses} data files parsed, {self.hits} cache hits, {self.missing} lookups of missing files"
@@ -0,0 +1,148 @@
+"""Page rendering executors.
+
+Builders describe each page as a ``PageJob``. Without an executor the job
+is rendered on the spot; a ``ProcessExecutor`` queues jobs and renders them
+in chunks across worker processes, each of which builds its Jinja
+environment once.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from jinja2 import Environment
+
+
+@dataclass(frozen=True)
+class PageJob:
+    """Everything needed to render one page; picklable for worker processes."""
+
+    template_name: str
+    output: Path
+    context: dict[str, Any]
+    # Module-level function deriving extra context at render time
+    prepare: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` unless ``path`` already holds exactly those bytes."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+WRITE_BUFFER = 256 * 1024
+
+
+def file_digest(path: Path) -> str | None:
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as handle:
+            while block := handle.read(WRITE_BUFFER):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def write_stream_if_changed(path: Path, chunks: Iterable[str]) -> bool:
+    """Stream text ``chunks`` to ``path`` unless it already holds the same bytes.
+
+    The chunks are written to a temporary file beside ``path`` and hashed
+    on the way, so the whole document is never held in memory. The file is
+    renamed into place only when its digest differs from the existing one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb", buffering=WRITE_BUFFER) as handle:
+            for chunk in chunks:
+                data = chunk.encode("utf-8")
+                digest.update(data)
+                handle.write(data)
+        if file_digest(path) == digest.hexdigest():
+            tmp.unlink()
+            return False
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+        return True
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def render_job(templates: Environment, job: PageJob) -> bool:
+    """Render ``job``; returns whether the output file changed."""
+    context = job.context
+    if job.prepare is not None:
+        context = {**context, **job.prepare(context)}
+    chunks = templates.get_template(job.template_name).generate(**context)
+    return write_stream_if_changed(job.output, chunks)
+
+
+_worker_templates: Environment | None = None
+
+
+def _init_worker(template_root: Path, cache_dir: Path | None) -> None:
+    global _worker_templates
+    from unigov.generator.builder import build_environment
+
+    _worker_templates = build_environment(template_root, cache_dir)
+
+
+def _render_in_worker(job: PageJob) -> bool:
+    assert _worker_templates is not None
+    return render_job(_worker_templates, job)
+
+
+class ProcessExecutor:
+    """Render queued pages on a process pool when ``flush`` is called."""
+
+    def __init__(self, template_root: Path, workers: int, cache_dir: Path | None = None) -> None:
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(template_root, cache_dir))
+        # Keyed by output path, so only one job ever writes a given file
+        self.pending: dict[Path, PageJob] = {}
+
+    def submit(self, job: PageJob) -> None:
+        """Queue ``job``, replacing any queued job for the same output.
+
+        The last submission wins, as it does when pages are rendered inline.
+        """
+        self.pending.pop(job.output, None)
+        self.pending[job.output] = job
+
+    def flush(self) -> int:
+        """Render the queued pages; returns how many output files changed."""
+        jobs, self.pending = list(self.pending.values()), {}
+        if not jobs:
+            return 0
+        # A few chunks per worker balances uneven pages without paying
+        # per-page IPC; shared context objects are pickled once per chunk.
+        chunksize = max(1, len(jobs) // (self.workers * 4))
+        return sum(self.pool.map(_render_in_worker, jobs, chunksize=chunksize))
+
+    def close(self) -> None:
+        self.pool.shutdown()
+
+    def __enter__(self) -> ProcessExecutor:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def resolve_workers(jobs: int) -> int:
+    """``-j`` value to a worker count; 0 means one per CPU."""
+    return jobs if jobs > 0 else os.cpu_count() or 1
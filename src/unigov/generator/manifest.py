@@ -0,0 +1,155 @@
+"""Build manifest for incremental rebuilds.
+
+Every page is fingerprinted from the templates it renders (including the
+templates they extend, include and import), the context it is rendered
+with, which carries the data records and config values, and the generator
+code itself. A page whose fingerprint and output file are unchanged since
+the previous build is not rendered again.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment, meta
+
+from unigov.generator import renderer
+from unigov.scraper.storage import atomic_write_bytes
+
+MANIFEST_VERSION = 1
+
+
+def _encode(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, Path):
+        return value.as_posix()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot fingerprint {type(value).__name__}")
+
+
+def value_digest(value: Any) -> str:
+    data = json.dumps(value, sort_keys=True, ensure_ascii=False, default=_encode)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def code_digest() -> str:
+    """Hash of the generator modules, whose filters and helpers shape every page.
+
+    The procedure-step rules are included too: meeting pages are rendered
+    from them, but they are loaded as data rather than as a template.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    rules = renderer.get_templates_path()
+    digest.update(rules.name.encode("utf-8"))
+    digest.update(rules.read_bytes())
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Fingerprint of every page written by previous builds, persisted as JSON."""
+
+    def __init__(self, path: Path, output_dir: Path, templates: Environment, force: bool = False) -> None:
+        self.path = path
+        self.output_dir = output_dir
+        self.templates = templates
+        # Render every page, but still record fingerprints and prune orphans
+        self.force = force
+        self.code = code_digest()
+        self.pages: dict[str, str] = {}
+        if path.exists():
+            raw = json.loads(path.read_text())
+            if raw.get("version") == MANIFEST_VERSION:
+                self.pages = raw.get("pages", {})
+        self._seen: set[str] = set()
+        self._templates: dict[str, str] = {}
+        # Large objects shared by many pages (e.g. the proposals map) are
+        # hashed once per build. The object is kept so its id is not reused.
+        self._shared: dict[int, tuple[Any, str]] = {}
+
+    def template_digest(self, name: str) -> str:
+        """Hash of ``name`` and every template it references, transitively."""
+        if name not in self._templates:
+            digest = hashlib.sha256()
+            pending, closure = [name], set()
+            while pending:
+                current = pending.pop()
+                if current in closure:
+                    continue
+                closure.add(current)
+                source, _, _ = self.templates.loader.get_source(self.templates, current)
+                referenced = meta.find_referenced_templates(self.templates.parse(source))
+                pending.extend(ref for ref in referenced if ref)
+            for current in sorted(closure):
+                source, _, _ = self.templates.loader.get_source(self.templates, current)
+                digest.update(current.encode("utf-8"))
+                digest.update(source.encode("utf-8"))
+            self._templates[name] = digest.hexdigest()
+        return self._templates[name]
+
+    def context_digest(self, context: dict[str, Any]) -> dict[str, str]:
+        digests = {}
+        for key, value in context.items():
+            if isinstance(value, (dict, list)) and len(value) > 32:
+                if id(value) not in self._shared:
+                    self._shared[id(value)] = (value, value_digest(value))
+                digests[key] = self._shared[id(value)][1]
+            else:
+                digests[key] = value_digest(value)
+        return digests
+
+    def fingerprint(self, template_name: str, context: dict[str, Any]) -> str:
+        parts = {
+            "code": self.code,
+            "template": self.template_digest(template_name),
+            "context": self.context_digest(context),
+        }
+        return value_digest(parts)
+
+    def is_current(self, output: Path, fingerprint: str) -> bool:
+        """Record ``output`` as part of this build and report whether it is up to date."""
+        key = output.relative_to(self.output_dir).as_posix()
+        self._seen.add(key)
+        return not self.force and self.pages.get(key) == fingerprint and output.exists()
+
+    def record(self, output: Path, fingerprint: str) -> None:
+        self.pages[output.relative_to(self.output_dir).as_posix()] = fingerprint
+
+    def remove_orphans(self) -> list[str]:
+        """Delete pages from earlier builds that this build no longer produces.
+
+        Only scopes this build rendered into (a body/committee/session
+        directory, or the site root) are pruned, so building one session
+        leaves the others alone.
+        """
+        scopes = {page_scope(key) for key in self._seen}
+        orphans = sorted(key for key in self.pages if key not in self._seen and page_scope(key) in scopes)
+        for key in orphans:
+            path = self.output_dir / key
+            path.unlink(missing_ok=True)
+            parent = path.parent
+            while parent != self.output_dir and parent.exists() and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+            del self.pages[key]
+        return orphans
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": MANIFEST_VERSION, "pages": dict(sorted(self.pages.items()))}
+        atomic_write_bytes(self.path, json.dumps(payload, indent=2).encode("utf-8"))
+
+
+def page_scope(key: str) -> str:
+    """``ga/plenary/80/meetings/index.html`` -> ``ga/plenary/80``; root pages -> ``""``."""
+    return "/".join(key.split("/")[:-1][:3])
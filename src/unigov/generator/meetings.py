@@ -0,0 +1,210 @@
+"""Meeting view models shared by the pages of a session.
+
+Every meeting of a session is turned into a ``MeetingView`` once per
+build. The view carries what the list, detail, session and home pages
+derive from the raw record: the parsed start, the month it is grouped
+under, its URL and whether it is still forthcoming. The session's views
+are sorted by start once, and pages select and group them from there.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+from markupsafe import Markup
+
+from unigov.generator.datastore import DataStore
+
+SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(text: str) -> str:
+    if not text:
+        return "meeting"
+    return SLUG_SEPARATORS.sub("-", text.lower()).strip("-")[:60]
+
+
+def _extract_date_parts(dt_str: str) -> tuple[str, str]:
+    """Extract YYMMDD and HH from datetime string.
+
+    Handles formats like:
+    - '2025-09-09T10:00:00' (ISO format)
+    - '2026-06-04 10:00' (space separator)
+
+    Returns:
+        date_part: YYMMDD format (e.g., '250909')
+        time_part: HH format (e.g., '09')
+    """
+    if not dt_str:
+        return "000000", "00"
+
+    # Handle space-separated format: '2026-06-04 10:00'
+    if " " in dt_str:
+        date_part_raw, time_part = dt_str.split(" ")
+        parts = date_part_raw.split("-")
+        if len(parts) >= 3:
+            year = parts[0][2:]  # Get YY from YYYY
+            month = parts[1]  # MM
+            day = parts[2]  # DD
+            date_part = f"{year}{month}{day}"  # YYMMDD
+        else:
+            date_part = "000000"
+        return date_part, time_part.split(":")[0] if ":" in time_part else time_part
+
+    # Handle ISO format: '2025-09-09T10:00:00'
+    if "T" in dt_str:
+        parts = dt_str.split("T")[0].split("-")
+        if len(parts) >= 3:
+            year = parts[0][2:]
+            month = parts[1]
+            day = parts[2]
+            date_part = f"{year}{month}{day}"
+        else:
+            date_part = "000000"
+        time_part = dt_str.split("T")[1].split(":")[0]
+        return date_part, time_part
+
+    return "000000", "00"
+
+
+def meeting_url(meeting: dict) -> str:
+    """Generate flat meeting URL like '25090910-informal-meeting-on-un80-initiative'."""
+    dt_str = meeting.get("MT_dateTimeScheduleStart", "")
+    date_part, time_part = _extract_date_parts(dt_str)
+    name = slugify(meeting.get("MT_name", ""))[:50]
+    return f"{date_part}{time_part}-{name}"
+
+
+def meeting_id(meeting: dict) -> str:
+    """Generate meeting folder ID like '25090910-informal-meeting-on-un80-initiative'."""
+    return meeting_url(meeting)
+
+
+def parse_start(value: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+@dataclass(frozen=True)
+class MeetingView:
+    """Display fields of one meeting, derived once from its record."""
+
+    # Meeting folder and URL segment, as ``meeting_url`` builds it
+    url: str
+    title: str
+    body: str
+    # Commentary with markup stripped, for one-line previews
+    summary: str
+    # Raw ``MT_dateTimeScheduleStart``
+    start: str
+    # Parsed start; the raw string when it does not parse
+    scheduled: datetime | str
+    # "2025-09-09" and "2025-09" (empty for a missing start)
+    date: str
+    month_key: str
+    # "September 2025", the heading of the month group
+    month_name: str
+    segment_count: int
+    # Scheduled today or later
+    forthcoming: bool
+
+    @classmethod
+    def build(cls, meeting: dict, today: str) -> MeetingView:
+        start = meeting.get("MT_dateTimeScheduleStart") or ""
+        parsed = parse_start(start)
+        day = start[:10]
+        return cls(
+            url=meeting_url(meeting),
+            title=meeting.get("MT_name") or "Meeting",
+            body=meeting.get("MT_body") or "",
+            summary=Markup(meeting.get("MT_commentary") or "").striptags(),
+            start=start,
+            scheduled=parsed or start,
+            date=day,
+            month_key=start[:7],
+            month_name=parsed.strftime("%B %Y") if parsed else start,
+            segment_count=len(meeting.get("MT_segment") or []),
+            forthcoming=day >= today,
+        )
+
+
+@dataclass(frozen=True)
+class MonthGroup:
+    name: str
+    meetings: tuple[MeetingView, ...]
+
+
+def group_by_month(views: list[MeetingView]) -> list[MonthGroup]:
+    """Consecutive runs of ``views`` that share a month, in their given order."""
+    groups: list[MonthGroup] = []
+    run: list[MeetingView] = []
+    for view in views:
+        if run and view.month_key != run[0].month_key:
+            groups.append(MonthGroup(run[0].month_name, tuple(run)))
+            run = []
+        run.append(view)
+    if run:
+        groups.append(MonthGroup(run[0].month_name, tuple(run)))
+    return groups
+
+
+class SessionMeetings:
+    """The meetings of one session and their views.
+
+    ``views`` follows the data file, like ``meetings``; ``by_start`` holds
+    the same views in start order. Sorts are stable, so meetings starting
+    at the same time keep their file order.
+    """
+
+    def __init__(self, meetings: list[dict], today: str) -> None:
+        self.meetings = meetings
+        self.today = today
+        self.views = [MeetingView.build(meeting, today) for meeting in meetings]
+        self.by_start = sorted(self.views, key=start_key)
+
+    def forthcoming(self) -> list[MeetingView]:
+        return [view for view in self.by_start if view.forthcoming]
+
+    def past(self) -> list[MeetingView]:
+        """Meetings before today, most recent first."""
+        return sorted((view for view in self.views if not view.forthcoming), key=start_key, reverse=True)
+
+    def recent(self, limit: int = 3) -> list[MeetingView]:
+        return sorted(self.views, key=start_key, reverse=True)[:limit]
+
+    def upcoming(self, limit: int = 6) -> list[MeetingView]:
+        return self.forthcoming()[:limit]
+
+    def next(self) -> MeetingView | None:
+        """The first meeting after today."""
+        for view in self.by_start:
+            if view.date > self.today:
+                return view
+        return None
+
+
+def start_key(view: MeetingView) -> str:
+    return view.start
+
+
+class MeetingIndex:
+    """``SessionMeetings`` per data directory, built at most once per build.
+
+    An entry is reused while the data store returns the same parsed list,
+    so a meetings file that changes mid-build gets fresh views.
+    """
+
+    def __init__(self, today: str | None = None) -> None:
+        self.today = today or date.today().isoformat()
+        self._sessions: dict[Path, SessionMeetings] = {}
+
+    def session(self, store: DataStore, data_dir: Path) -> SessionMeetings:
+        meetings = store.meetings(data_dir)
+        cached = self._sessions.get(data_dir)
+        if cached is None or cached.meetings is not meetings:
+            cached = self._sessions[data_dir] = SessionMeetings(meetings, self.today)
+        return cached
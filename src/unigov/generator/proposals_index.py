@@ -0,0 +1,97 @@
+"""Persistent cross-reference index over the GA proposals files.
+
+Procedure steps refer to draft resolutions by PSID, and resolutions to
+their drafts by number. Instead of walking and parsing every
+``data/ga/<committee>/<session>/proposals.json`` on each build, the
+entries extracted from each file are cached on disk with a digest of its
+contents, and only re-extracted when those contents change. File times
+are not used, so a fresh checkout with a restored cache reuses it.
+"""
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+from unigov.generator.datastore import DataStore
+from unigov.generator.executor import file_digest
+from unigov.scraper.storage import atomic_write_bytes
+
+INDEX_VERSION = 2
+# "A/80/L.12 DR 5"-style draft symbols carry the session after the body prefix
+DRAFT_SESSION = re.compile(r"^A/(\d+)/")
+
+
+def extract_entries(proposals: list[dict]) -> dict[str, dict]:
+    """The PSID and resolution entries of one proposals file."""
+    psids: dict[str, dict] = {}
+    resolutions: dict[str, str] = {}
+    for proposal in proposals:
+        title = proposal.get("PR_Title")
+        for stage in proposal.get("PR_Stage", []):
+            doc_symbol = stage.get("DocSymbol", "")
+            if not doc_symbol or "DR " not in doc_symbol:
+                continue
+            for vote in stage.get("VotesAdd", []):
+                psid = vote.get("PSID")
+                if psid:
+                    entry = psids.setdefault(str(psid), {})
+                    entry["draft_symbol"] = doc_symbol
+                    if title:
+                        entry["title"] = title
+            match = DRAFT_SESSION.match(doc_symbol)
+            if match:
+                number = doc_symbol.split("DR ")[-1].strip()
+                resolutions.setdefault(f"{match.group(1)}/{number}", doc_symbol)
+    return {"psids": psids, "resolutions": resolutions}
+
+
+class ProposalsIndex:
+    """Draft resolutions keyed by PSID, and their symbols by resolution number.
+
+    ``path`` is the JSON file the per-file entries persist in; without it
+    the index lives for one build only.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._files: dict[str, dict[str, Any]] = {}
+        if path is not None and path.exists():
+            raw = json.loads(path.read_text())
+            if raw.get("version") == INDEX_VERSION:
+                self._files = raw.get("files", {})
+        self.by_psid: dict[str, dict] = {}
+        self.resolutions: dict[str, str] = {}
+        self.reindexed = 0
+
+    def refresh(self, data_dir: Path, store: DataStore) -> None:
+        """Re-extract changed proposals files under ``data_dir/ga`` and rebuild the lookups."""
+        files = sorted((data_dir / "ga").glob("*/*/proposals.json"))
+        current: dict[str, dict[str, Any]] = {}
+        for path in files:
+            key = path.relative_to(data_dir).as_posix()
+            stamp = file_digest(path)
+            cached = self._files.get(key)
+            if cached is None or cached["stamp"] != stamp:
+                cached = {"stamp": stamp, **extract_entries(store.proposals(path.parent))}
+                self.reindexed += 1
+            current[key] = cached
+        self._files = current
+
+        self.by_psid, self.resolutions = {}, {}
+        for entries in self._files.values():
+            for psid, entry in entries["psids"].items():
+                self.by_psid.setdefault(psid, {}).update(entry)
+            for number, symbol in entries["resolutions"].items():
+                self.resolutions.setdefault(number, symbol)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": INDEX_VERSION, "files": self._files}
+        atomic_write_bytes(self.path, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def summary(self) -> str:
+        return f"{len(self._files)} proposals files indexed, {self.reindexed} re-read"
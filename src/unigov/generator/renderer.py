@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import yaml
 import re
@@ -215,7 +216,57 @@ UN_OFFICIAL_COUNTRY_NAMES = {
 }
 
 
+# Keys with trailing whitespace are variants of the stripped key
+_OFFICIAL_NAMES = {key.strip(): official for key, official in UN_OFFICIAL_COUNTRY_NAMES.items()}
+
+
+def _trie_pattern(keys: list[str]) -> str:
+    """Alternation of ``keys`` factored into a character trie.
+
+    The regex engine then branches on each character instead of trying
+    every key at every position, and a greedy optional tail makes longer
+    keys win ("NIGERIA" over "NIGER", "SOUTH SUDAN" over "SUDAN").
+    """
+    trie: dict[str, dict] = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            return f"(?:{body})?" if len(branches) == 1 else f"{body}?"
+        return body
+
+    return build(trie)
+
+
+_COUNTRY_PATTERN = re.compile(_trie_pattern(list(_OFFICIAL_NAMES)), re.IGNORECASE)
+
+
+def _official_match(match: re.Match) -> str:
+    text = match.group(0)
+    official = _OFFICIAL_NAMES.get(text.upper())
+    if official is None:
+        # Case-insensitive matches whose uppercase differs from the key ("türkiye")
+        official = next(
+            value for key, value in _OFFICIAL_NAMES.items() if re.fullmatch(re.escape(key), text, re.IGNORECASE)
+        )
+    return official
+
+
+@lru_cache(maxsize=4096)
 def normalize_country_name(name: str, strip_parenthesized: bool = False) -> str:
+    """Official spelling of ``name``, and of country names in its parenthesised qualifier.
+
+    Speaker names repeat across every step of every meeting, so results
+    are memoized.
+    """
     name = name.strip()
 
     parenthesized = ""
@@ -224,21 +275,10 @@ def normalize_country_name(name: str, strip_parenthesized: bool = False) -> str:
         parenthesized = name[paren_start:]
         name = name[:paren_start].strip()
 
-    name_upper = name.upper()
-    if name_upper in UN_OFFICIAL_COUNTRY_NAMES:
-        name = UN_OFFICIAL_COUNTRY_NAMES[name_upper]
+    name = _OFFICIAL_NAMES.get(name.upper(), name)
 
     if parenthesized and not strip_parenthesized:
-        normalized_paren = parenthesized
-        for upper_name, official in UN_OFFICIAL_COUNTRY_NAMES.items():
-            if upper_name in parenthesized.upper():
-                normalized_paren = re.sub(
-                    re.escape(upper_name),
-                    official,
-                    normalized_paren,
-                    flags=re.IGNORECASE,
-                )
-        name = f"{name} {normalized_paren}"
+        name = f"{name} {_COUNTRY_PATTERN.sub(_official_match, parenthesized)}"
 
     return name
 
@@ -393,6 +433,11 @@ def render_step(step: dict, templates: dict) -> dict:
 
 
 def render_procedure_steps(steps: list[dict]) -> list[dict]:
+    """Interpret ``procedure_steps.yaml`` step by step.
+
+    Builds use the compiled ``step_engine.render_procedure_steps``; this
+    is the reference its output is checked against.
+    """
     templates = load_templates()
     return [render_step(step, templates) for step in steps]
 
@@ -0,0 +1,268 @@
+"""Procedure-step rules compiled from ``procedure_steps.yaml``.
+
+``renderer.render_step`` interprets the YAML for every step: it looks up
+the variants, re-splits every dotted field path and fills the template
+with one ``str.replace`` per placeholder. ``StepEngine`` does that work
+once. Each step type maps to a tuple of compiled variants, made of
+condition predicates, pre-split field accessors, transform chains and a
+format plan (the template as a positional ``str.format`` string). The
+output is identical to ``renderer.render_step``.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from unigov.generator.renderer import load_templates, normalize_country_name
+
+# A placeholder such as ``{symbol}``; braces anywhere else disable the format plan
+PLACEHOLDER = re.compile(r"\{([^{}]*)\}")
+
+Accessor = Callable[[Any], Any]
+
+
+def compile_path(path: str) -> Accessor:
+    """Accessor equivalent to ``renderer.get_field(data, path)``."""
+    keys = []
+    for key in path.split("."):
+        try:
+            index: int | None = int(key)
+        except ValueError:
+            index = None
+        keys.append((key, index))
+
+    if len(keys) == 1 and keys[0][1] is None:
+        # Plain top-level keys are by far the most common path
+        key = keys[0][0]
+
+        def get_key(data: Any) -> Any:
+            if isinstance(data, dict):
+                value = data.get(key, "")
+                return "" if value is None else value
+            return ""
+
+        return get_key
+
+    steps = tuple(keys)
+
+    def get(data: Any) -> Any:
+        value = data
+        for key, index in steps:
+            if value is None:
+                return ""
+            if isinstance(value, list):
+                if index is None:
+                    return ""
+                value = value[index] if index < len(value) else ""
+            elif isinstance(value, dict):
+                value = value.get(key, "")
+            else:
+                return ""
+            if value is None:
+                return ""
+        return value
+
+    return get
+
+
+def compile_transforms(transforms: list[str] | str) -> tuple[tuple[str, str], ...]:
+    if isinstance(transforms, str):
+        transforms = [transforms]
+    chain = []
+    for transform in transforms:
+        kind, separator, argument = transform.partition(":")
+        if separator and kind in ("strip_prefix", "strip_suffix"):
+            chain.append((kind, argument))
+    return tuple(chain)
+
+
+def compile_field(get: Accessor, transforms: tuple[tuple[str, str], ...] | None) -> Callable[[dict], str]:
+    """Text of one placeholder, as ``renderer.render_step_text`` computes it.
+
+    ``transforms`` is None for plain path fields, whose values are used
+    untransformed.
+    """
+    if transforms is None:
+        def value(step: dict) -> str:
+            found = get(step)
+            return str(found) if found else ""
+
+        return value
+
+    def transformed(step: dict) -> str:
+        found = get(step)
+        if not found:
+            return ""
+        text = str(found)
+        for kind, argument in transforms:
+            if kind == "strip_prefix":
+                if text.startswith(argument):
+                    text = text[len(argument):]
+            elif text.endswith(argument):
+                text = text[:-len(argument)]
+        return text
+
+    return transformed
+
+
+def compile_condition(condition: dict) -> Callable[[dict], bool] | None:
+    """Predicate equivalent to ``renderer.check_condition``; None when it always holds."""
+    if not condition:
+        return None
+    checks = tuple((compile_path(key), expected, expected == "present") for key, expected in condition.items())
+
+    def matches(step: dict) -> bool:
+        for get, expected, present in checks:
+            actual = get(step)
+            if present:
+                if not actual:
+                    return False
+            elif actual != expected:
+                return False
+        return True
+
+    return matches
+
+
+def format_plan(template: str, placeholders: list[str]) -> str | None:
+    """``template`` as a positional format string, or None if it holds stray braces.
+
+    Placeholders that are not fields (``{speaker}``) are kept literally.
+    """
+    indexes: dict[str, int] = {}
+    for index, placeholder in enumerate(placeholders):
+        indexes.setdefault(placeholder, index)
+    parts = []
+    position = 0
+    for match in PLACEHOLDER.finditer(template):
+        literal = template[position:match.start()]
+        if "{" in literal or "}" in literal:
+            return None
+        name = match.group(1)
+        parts.append(literal)
+        parts.append(f"{{{indexes[name]}}}" if name in indexes else f"{{{{{name}}}}}")
+        position = match.end()
+    rest = template[position:]
+    if "{" in rest or "}" in rest:
+        return None
+    parts.append(rest)
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class Variant:
+    matches: Callable[[dict], bool] | None
+    template: str
+    placeholders: tuple[str, ...]
+    values: tuple[Callable[[dict], str], ...]
+    plan: str | None
+    # (list accessor, name accessor, intro mode), or None without speakers
+    speakers: tuple[Accessor, Accessor, bool] | None
+
+    def text(self, step: dict) -> str:
+        values = [value(step) for value in self.values]
+        if self.plan is not None:
+            joined = "".join(values)
+            if "{" not in joined and "}" not in joined:
+                return self.plan.format(*values)
+        # Substituted values may themselves contain placeholders; replace in
+        # field order exactly as ``renderer.render_step_text`` does.
+        text = self.template
+        for placeholder, value in zip(self.placeholders, values):
+            text = text.replace(f"{{{placeholder}}}", value)
+        return text
+
+    def speaker_list(self, step: dict) -> list[dict]:
+        assert self.speakers is not None
+        get_speakers, get_name, intro_mode = self.speakers
+        speakers = []
+        raw_speakers = get_speakers(step)
+        if isinstance(raw_speakers, list):
+            for sp in raw_speakers:
+                name = get_name(sp)
+                if name and not name.startswith("------"):
+                    name = normalize_country_name(name, strip_parenthesized=True)
+                    speakers.append({"name": name, "is_intro": intro_mode})
+        return speakers
+
+
+def compile_variant(variant: dict) -> Variant:
+    placeholders = []
+    values = []
+    for placeholder, config in variant.get("fields", {}).items():
+        placeholders.append(placeholder)
+        if isinstance(config, dict):
+            transforms = compile_transforms(config.get("transform", []))
+            values.append(compile_field(compile_path(config.get("path", "")), transforms))
+        else:
+            values.append(compile_field(compile_path(config), None))
+    template = variant.get("template", "")
+    speakers_config = variant.get("speakers", {})
+    speakers = None
+    if speakers_config:
+        speakers = (
+            compile_path(speakers_config.get("path", "")),
+            compile_path(speakers_config.get("name_field", "SP_entity.SP_entity")),
+            speakers_config.get("intro_mode", False),
+        )
+    return Variant(
+        compile_condition(variant.get("condition", {})),
+        template,
+        tuple(placeholders),
+        tuple(values),
+        format_plan(template, placeholders),
+        speakers,
+    )
+
+
+class StepEngine:
+    """Dispatch table from ``PS_type_label`` to compiled variants."""
+
+    def __init__(self, templates: dict) -> None:
+        self.rules: dict[str, tuple[Variant, ...]] = {}
+        for step_type, config in templates.items():
+            if isinstance(config, list):
+                variants = config
+            elif isinstance(config, dict):
+                variants = [config]
+            else:
+                variants = []
+            self.rules[step_type] = tuple(compile_variant(variant) for variant in variants)
+
+    def render(self, step: dict) -> dict:
+        step_type = step.get("PS_type_label", "")
+        for variant in self.rules.get(step_type, ()):
+            if variant.matches is not None and not variant.matches(step):
+                continue
+            text = variant.text(step)
+            speakers = variant.speaker_list(step) if variant.speakers is not None else []
+            if speakers and "{speaker}" in text:
+                text = text.replace("{speaker}", f"The representative of {speakers[0].get('name', '')}")
+            text = text.strip()
+            if not text:
+                text = step.get("PS_title", "").strip()
+            return {"type_label": step_type, "text": text, "speakers": speakers, "seqNo": step.get("seqNo")}
+
+        fallback = step.get("PS_title", "").strip() or step_type
+        return {"type_label": step_type, "text": fallback, "speakers": [], "seqNo": step.get("seqNo")}
+
+    def render_all(self, steps: list[dict]) -> list[dict]:
+        """Render a meeting's steps in one call."""
+        render = self.render
+        return [render(step) for step in steps]
+
+
+_engine: StepEngine | None = None
+
+
+def step_engine() -> StepEngine:
+    """The engine for ``procedure_steps.yaml``, compiled on first use."""
+    global _engine
+    if _engine is None:
+        _engine = StepEngine(load_templates())
+    return _engine
+
+
+def render_procedure_steps(steps: list[dict]) -> list[dict]:
+    return step_engine().render_all(steps)
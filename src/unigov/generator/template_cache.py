@@ -0,0 +1,104 @@
+"""Compiled template caches.
+
+Templates are loaded from one of two caches under ``site.cache_dir``:
+
+* ``templates-compiled/``, a bundle written by ``unigov templates compile``
+  with every template compiled to a Python module. It is used only while
+  the digest it was compiled from matches the template sources.
+* ``jinja-bytecode/``, Jinja's bytecode cache, which every build fills so
+  later builds and render workers skip parsing and compiling.
+"""
+from __future__ import annotations
+
+import compileall
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader
+
+BUNDLE_DIR = "templates-compiled"
+BYTECODE_DIR = "jinja-bytecode"
+# Digest of the template sources a bundle was compiled from
+DIGEST_NAME = "SOURCES"
+TEMPLATE_EXTENSIONS = ("html",)
+
+
+def source_digest(template_root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(template_root.rglob("*")):
+        if path.is_file() and path.suffix.lstrip(".") in TEMPLATE_EXTENSIONS:
+            digest.update(path.relative_to(template_root).as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class CompiledLoader(ModuleLoader):
+    """Precompiled templates that still expose their sources for fingerprinting."""
+
+    has_source_access = True
+
+    def __init__(self, bundle: Path, template_root: Path) -> None:
+        super().__init__(str(bundle))
+        self.sources = FileSystemLoader(str(template_root))
+
+    def get_source(self, environment: Environment, template: str) -> tuple[str, str | None, object]:
+        return self.sources.get_source(environment, template)
+
+    def list_templates(self) -> list[str]:
+        return self.sources.list_templates()
+
+
+def bundle_is_current(bundle: Path, template_root: Path) -> bool:
+    stamp = bundle / DIGEST_NAME
+    return stamp.exists() and stamp.read_text().strip() == source_digest(template_root)
+
+
+def template_loader(template_root: Path, cache_dir: Path | None) -> BaseLoader:
+    """The compiled bundle when it is up to date, otherwise the template sources."""
+    if cache_dir is not None:
+        bundle = cache_dir / BUNDLE_DIR
+        if bundle_is_current(bundle, template_root):
+            return CompiledLoader(bundle, template_root)
+    return FileSystemLoader(str(template_root))
+
+
+def bytecode_cache(cache_dir: Path | None) -> FileSystemBytecodeCache | None:
+    if cache_dir is None:
+        return None
+    directory = cache_dir / BYTECODE_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(directory))
+
+
+def compile_bundle(templates: Environment, template_root: Path, cache_dir: Path) -> Path:
+    """Compile every template into ``cache_dir/templates-compiled``.
+
+    The bundle is written beside the old one and swapped in, so a build
+    starting meanwhile loads either the old bundle or the new one.
+    """
+    bundle = cache_dir / BUNDLE_DIR
+    staging = cache_dir / f"{BUNDLE_DIR}.tmp"
+    if staging.exists():
+        shutil.rmtree(staging)
+    digest = source_digest(template_root)
+    templates.compile_templates(
+        str(staging),
+        extensions=TEMPLATE_EXTENSIONS,
+        zip=None,
+        ignore_errors=False,
+    )
+    # Byte-compile the modules now; imports would otherwise recompile them
+    # wherever writing bytecode is disabled (e.g. PYTHONDONTWRITEBYTECODE).
+    compileall.compile_dir(str(staging), quiet=1)
+    (staging / DIGEST_NAME).write_text(f"{digest}\n")
+    if bundle.exists():
+        previous = cache_dir / f"{BUNDLE_DIR}.old"
+        shutil.rmtree(previous, ignore_errors=True)
+        os.rename(bundle, previous)
+        os.rename(staging, bundle)
+        shutil.rmtree(previous)
+    else:
+        os.rename(staging, bundle)
+    return bundle
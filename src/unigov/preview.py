@@ -0,0 +1,64 @@
+"""Local preview server that serves precompressed variants.
+
+A request whose ``Accept-Encoding`` allows zstd or gzip is answered with the
+``.zst`` or ``.gz`` sibling written by ``unigov build --compress`` when one
+exists, so transfer sizes match a host serving precompressed assets.
+"""
+from __future__ import annotations
+
+import http.server
+import os
+from pathlib import Path
+from typing import BinaryIO
+from urllib.parse import urlsplit
+
+from unigov.generator.compress import ENCODING_SUFFIXES
+
+
+def accepted_encodings(header: str | None) -> set[str]:
+    """Codings an ``Accept-Encoding`` header allows, ignoring those with ``q=0``."""
+    accepted = set()
+    for part in (header or "").split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name)
+    return accepted
+
+
+class PrecompressedHandler(http.server.SimpleHTTPRequestHandler):
+    def send_head(self) -> BinaryIO | None:  # type: ignore[override]
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            if not urlsplit(self.path).path.endswith("/"):
+                return super().send_head()
+            path = path / "index.html"
+
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            variant = path.with_name(path.name + suffix)
+            if (encoding in accepted or "*" in accepted) and variant.is_file() and path.is_file():
+                return self.send_variant(path, variant, encoding)
+        return super().send_head()
+
+    def send_variant(self, path: Path, variant: Path, encoding: str) -> BinaryIO:
+        handle = variant.open("rb")
+        stat = os.fstat(handle.fileno())
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(stat.st_size))
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+        self.end_headers()
+        return handle
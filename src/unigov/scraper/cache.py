@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str | None
+    last_modified: str | None
+    sha256: str
+    size: int
+
+
+class ValidatorCache:
+    """Per-endpoint HTTP validators persisted in a JSON sidecar.
+
+    Each API path maps to the ``ETag``/``Last-Modified`` headers and the
+    content hash of the last payload written to disk, so the next run can
+    send a conditional request and recognise unchanged bodies. Validators
+    of a new response are staged until ``commit`` confirms the payload is
+    on disk, so a failed write never leaves headers for a file that does
+    not match them.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, Validators] = {}
+        self._staged: dict[str, Validators] = {}
+        if path.exists():
+            raw = json.loads(path.read_text())
+            self._entries = {key: Validators(**value) for key, value in raw.items()}
+
+    def get(self, api_path: str) -> Validators | None:
+        return self._entries.get(api_path)
+
+    def request_headers(self, api_path: str) -> dict[str, str]:
+        entry = self._entries.get(api_path)
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def is_unchanged(self, api_path: str, body: bytes) -> bool:
+        entry = self._entries.get(api_path)
+        return entry is not None and entry.sha256 == content_hash(body)
+
+    def stage(self, api_path: str, response: httpx.Response, body: bytes) -> None:
+        self._staged[api_path] = Validators(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            sha256=content_hash(body),
+            size=len(body),
+        )
+
+    def commit(self, api_path: str) -> None:
+        """Record the staged validators of ``api_path`` once its payload is stored."""
+        entry = self._staged.pop(api_path, None)
+        if entry is not None:
+            self._entries[api_path] = entry
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {key: asdict(value) for key, value in sorted(self._entries.items())}
+        self.path.write_text(json.dumps(payload, indent=2))
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+FEED_NAME = "changes.jsonl"
+
+
+def meeting_key(record: dict) -> str:
+    if record.get("_id"):
+        return str(record["_id"])
+    return f"{record.get('MT_dateTimeScheduleStart', '')}|{record.get('MT_name', '')}"
+
+
+def proposal_key(record: dict) -> str:
+    return str(record.get("_id", ""))
+
+
+def decision_key(record: dict) -> str:
+    return str(record.get("ED_DecisionNumber", ""))
+
+
+RECORD_KEYS: dict[str, Callable[[dict], str]] = {
+    "meetings": meeting_key,
+    "proposals": proposal_key,
+    "decisions": decision_key,
+}
+
+
+def payload_records(payload: Any) -> list[dict]:
+    """Records of a meetings/decisions list or a proposals ``{"result": [...]}`` envelope."""
+    if isinstance(payload, dict):
+        payload = payload.get("result") or []
+    if not isinstance(payload, list):
+        return []
+    return [record for record in payload if isinstance(record, dict)]
+
+
+def diff_records(category: str, old_payload: Any, new_payload: Any) -> list[dict]:
+    """Added, changed and removed records between two payloads of ``category``.
+
+    Added records are stored whole; changed ones only carry the new values
+    of the fields that differ.
+    """
+    key = RECORD_KEYS[category]
+    old = {key(record): record for record in payload_records(old_payload)}
+    new = {key(record): record for record in payload_records(new_payload)}
+
+    entries: list[dict] = []
+    for record_id, record in new.items():
+        previous = old.get(record_id)
+        if previous is None:
+            entries.append({"op": "added", "id": record_id, "record": record})
+        elif previous != record:
+            fields = sorted(name for name in previous.keys() | record.keys() if previous.get(name) != record.get(name))
+            values = {name: record.get(name) for name in fields}
+            entries.append({"op": "changed", "id": record_id, "fields": fields, "values": values})
+    for record_id, record in old.items():
+        if record_id not in new:
+            entries.append({"op": "removed", "id": record_id, "record": record})
+    return entries
+
+
+def append_changes(session_dir: Path, category: str, entries: list[dict], when: datetime | None = None) -> None:
+    """Append ``entries`` to the session's ``changes.jsonl`` feed."""
+    if not entries:
+        return
+    stamp = (when or datetime.now(timezone.utc)).isoformat(timespec="seconds")
+    with (session_dir / FEED_NAME).open("a", encoding="utf-8") as handle:
+        for entry in entries:
+            line = {"time": stamp, "category": category, **entry}
+            handle.write(json.dumps(line, ensure_ascii=False) + "\n")
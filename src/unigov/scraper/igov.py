@@ -1,59 +1,328 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+from unigov.config import SessionConfig
+from unigov.scraper.cache import ValidatorCache
+from unigov.scraper.changes import RECORD_KEYS, append_changes, diff_records
+from unigov.scraper.ratelimit import RequestGovernor, RetryPolicy, TokenBucket
+from unigov.scraper.schedule import CheckpointJournal, FetchLedger, Scheduler
+from unigov.scraper.stats import ScrapeStats
+from unigov.scraper.storage import read_bytes, write_json, write_manifest
+from unigov.snapshot import publish_snapshot, stage_snapshot
+from unigov.scraper.plan import (
+    ScrapeJob,
+    ScrapeTarget,
+    ga_agenda_path,
+    ga_decisions_path,
+    ga_documents_path,
+    ga_meetings_path,
+    ga_proposals_path,
+    ga_targets,
+    plan_targets,
+)
+
 BASE_URL = "https://igov.un.org/igov/api"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE = 10.0
+
+# Returned by ``get`` instead of a payload when the copy on disk is current.
+NOT_MODIFIED: Any = object()
+
+
+def state_dir(data_root: Path) -> Path:
+    """Directory holding scraper bookkeeping that lives next to the data."""
+    return data_root / ".scrape"
+
+
+def open_journal(data_root: Path, resume: bool) -> CheckpointJournal:
+    """The checkpoint journal, emptied first unless the run resumes an interrupted one."""
+    journal = CheckpointJournal(state_dir(data_root) / "checkpoint.jsonl")
+    if not resume:
+        journal.clear()
+    return journal
+
+
+def conditional_headers(cache: ValidatorCache | None, path: str, conditional: bool) -> dict[str, str]:
+    if cache is None or not conditional:
+        return {}
+    return cache.request_headers(path)
+
+
+def decode_response(
+    response: httpx.Response,
+    path: str,
+    cache: ValidatorCache | None,
+    stats: ScrapeStats,
+    conditional: bool,
+) -> Any:
+    stats.requests += 1
+    if response.status_code == 304 and cache is not None:
+        entry = cache.get(path)
+        stats.not_modified += 1
+        stats.avoided_bytes += entry.size if entry else 0
+        return NOT_MODIFIED
+    response.raise_for_status()
+    body = response.content
+    stats.downloaded_bytes += len(body)
+    if cache is not None:
+        unchanged = conditional and cache.is_unchanged(path, body)
+        cache.stage(path, response, body)
+        if unchanged:
+            stats.unchanged += 1
+            return NOT_MODIFIED
+    return response.json()
+
+
+class ScrapeError(RuntimeError):
+    def __init__(self, stats: ScrapeStats) -> None:
+        super().__init__(f"{len(stats.failures)} endpoint(s) failed: {', '.join(sorted(stats.failures))}")
+        self.stats = stats
 
 
 class IGovClient:
-    def __init__(self, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        cache: ValidatorCache | None = None,
+        stats: ScrapeStats | None = None,
+        limiter: TokenBucket | None = None,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str | None = None,
+    ) -> None:
         self._client = httpx.Client(timeout=timeout)
+        self.base_url = (base_url or BASE_URL).rstrip("/")
+        self.cache = cache
+        self.stats = stats or ScrapeStats()
+        self.governor = RequestGovernor(limiter or TokenBucket(DEFAULT_RATE), retry_policy or RetryPolicy(), self.stats)
 
     def close(self) -> None:
         self._client.close()
 
-    def get(self, path: str) -> Any:
-        response = self._client.get(f"{BASE_URL}/{path}")
-        response.raise_for_status()
-        return response.json()
+    def get(self, path: str, conditional: bool = True) -> Any:
+        """Return the decoded payload, or ``NOT_MODIFIED`` if the cached copy is current.
+
+        Pass ``conditional=False`` when there is no stored copy to fall back on.
+        The response's validators are only staged; call ``cache.commit(path)``
+        once the payload is stored.
+        """
+        headers = conditional_headers(self.cache, path, conditional)
+        attempt = 0
+        while True:
+            time.sleep(self.governor.wait())
+            try:
+                response = self._client.get(f"{self.base_url}/{path}", headers=headers)
+            except httpx.TransportError as exc:
+                delay = self.governor.retry_delay(path, attempt, error=exc)
+            else:
+                delay = self.governor.retry_delay(path, attempt, response=response)
+                if delay is None:
+                    return decode_response(response, path, self.cache, self.stats, conditional)
+            time.sleep(delay or 0.0)
+            attempt += 1
 
     def post(self, path: str, payload: dict[str, Any]) -> Any:
-        response = self._client.post(f"{BASE_URL}/{path}", json=payload)
+        response = self._client.post(f"{self.base_url}/{path}", json=payload)
         response.raise_for_status()
         return response.json()
 
 
-def ensure_dir(path: Path) -> None:
-    path.mkdir(parents=True, exist_ok=True)
+class AsyncIGovClient:
+    """Asynchronous client sharing one connection pool across all requests."""
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = DEFAULT_CONCURRENCY,
+        cache: ValidatorCache | None = None,
+        stats: ScrapeStats | None = None,
+        limiter: TokenBucket | None = None,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._client = httpx.AsyncClient(timeout=timeout, limits=limits)
+        self.base_url = (base_url or BASE_URL).rstrip("/")
+        self.cache = cache
+        self.stats = stats or ScrapeStats()
+        self.governor = RequestGovernor(limiter or TokenBucket(DEFAULT_RATE), retry_policy or RetryPolicy(), self.stats)
+
+    async def close(self) -> None:
+        await self._client.aclose()
 
+    async def get(self, path: str, conditional: bool = True) -> Any:
+        headers = conditional_headers(self.cache, path, conditional)
+        attempt = 0
+        while True:
+            await asyncio.sleep(self.governor.wait())
+            try:
+                response = await self._client.get(f"{self.base_url}/{path}", headers=headers)
+            except httpx.TransportError as exc:
+                delay = self.governor.retry_delay(path, attempt, error=exc)
+            else:
+                delay = self.governor.retry_delay(path, attempt, response=response)
+                if delay is None:
+                    return decode_response(response, path, self.cache, self.stats, conditional)
+            await asyncio.sleep(delay or 0.0)
+            attempt += 1
 
-def write_json(path: Path, payload: Any) -> None:
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=True))
 
+def ensure_dir(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
 
+
+# The fetch helpers always return a payload: they request unconditionally,
+# so they never hand callers the ``NOT_MODIFIED`` sentinel.
 def fetch_ga_meetings(client: IGovClient, session_label: str) -> Any:
-    return client.get(f"meetings/getbysession/{session_label}?body=GA")
+    return client.get(ga_meetings_path(session_label), conditional=False)
 
 
 def fetch_ga_agenda(client: IGovClient, session_number: str) -> Any:
-    return client.get(f"getlookups/getAgendas/{session_number}")
+    return client.get(ga_agenda_path(session_number), conditional=False)
 
 
 def fetch_ga_documents(client: IGovClient, session_label: str) -> Any:
-    return client.get(f"meetings/getdocumentsbysession/{session_label}?body=GA")
+    return client.get(ga_documents_path(session_label), conditional=False)
 
 
 def fetch_ga_decisions(client: IGovClient, decision_label: str) -> Any:
-    return client.get(f"decision/getbysession/{decision_label}")
+    return client.get(ga_decisions_path(decision_label), conditional=False)
 
 
 def fetch_ga_proposals(client: IGovClient, session_label: str, committee_name: str) -> Any:
-    committee_value = httpx.QueryParams({"c": committee_name}).get("c")
-    return client.get(f"proposals/{session_label}/{committee_value}?env=prod")
+    return client.get(ga_proposals_path(session_label, committee_name), conditional=False)
+
+
+async def run_jobs(
+    jobs: list[ScrapeJob],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: ValidatorCache | None = None,
+    ledger: FetchLedger | None = None,
+    rate: float = DEFAULT_RATE,
+    retry_policy: RetryPolicy | None = None,
+    base_url: str | None = None,
+    journal: CheckpointJournal | None = None,
+) -> ScrapeStats:
+    """Fetch every job over one pooled client, at most ``concurrency`` at a time.
+
+    A job that still fails after its retries is recorded in
+    ``stats.failures``; the remaining jobs carry on. Completed jobs are
+    appended to ``journal`` as they finish.
+    """
+    concurrency = max(1, concurrency)
+    client = AsyncIGovClient(
+        max_connections=concurrency,
+        cache=cache,
+        limiter=TokenBucket(rate, burst=concurrency),
+        retry_policy=retry_policy,
+        base_url=base_url,
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(job: ScrapeJob) -> None:
+        async with semaphore:
+            try:
+                payload = await client.get(job.path, conditional=job.output.exists())
+            except httpx.HTTPError as exc:
+                client.stats.failures[job.path] = str(exc)
+                return
+        if payload is not NOT_MODIFIED:
+            ensure_dir(job.output.parent)
+            previous = read_bytes(job.output) if job.category in RECORD_KEYS else None
+            change = write_json(job.output, payload, current=previous)
+            if change is None:
+                client.stats.identical_writes += 1
+            else:
+                client.stats.changes.append(change)
+                # A first download has nothing to compare with; logging every
+                # record as added would only copy the file into the feed
+                if previous is not None:
+                    append_changes(job.output.parent, job.category, diff_records(job.category, json.loads(previous), payload))
+        if cache is not None:
+            cache.commit(job.path)
+        if ledger is not None:
+            ledger.record(job)
+        if journal is not None:
+            journal.record(job)
+
+    try:
+        await asyncio.gather(*(run(job) for job in jobs))
+    finally:
+        await client.close()
+    return client.stats
+
+
+def scrape_jobs(
+    jobs: list[ScrapeJob],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: ValidatorCache | None = None,
+    ledger: FetchLedger | None = None,
+    rate: float = DEFAULT_RATE,
+    retry_policy: RetryPolicy | None = None,
+    base_url: str | None = None,
+    journal: CheckpointJournal | None = None,
+) -> ScrapeStats:
+    """Run ``jobs`` to completion and persist the scraper state.
+
+    The checkpoint ``journal`` is cleared once every job has succeeded, and
+    kept otherwise so the next run can resume.
+    """
+    try:
+        stats = asyncio.run(run_jobs(jobs, concurrency, cache, ledger, rate, retry_policy, base_url, journal))
+        if journal is not None and not stats.failures:
+            journal.clear()
+        return stats
+    finally:
+        if cache is not None:
+            cache.save()
+        if ledger is not None:
+            ledger.save()
+
+
+def run_scrape(
+    data_root: Path,
+    targets: list[ScrapeTarget],
+    categories: set[str],
+    *,
+    force: bool = False,
+    resume: bool = False,
+    freshness: dict[str, dict[str, float]] | None = None,
+    snapshots: int = 0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE,
+    retry_policy: RetryPolicy | None = None,
+    base_url: str | None = None,
+) -> ScrapeStats:
+    """Plan ``targets``, fetch the units that are due and record the run.
+
+    Units inside their ``freshness`` window are skipped unless ``force``
+    is set. With ``resume``, units completed by an interrupted run are
+    skipped while they are still fresh. With ``snapshots``, the data is
+    staged and published as a new snapshot, keeping that many. A run with
+    failures publishes nothing and leaves the staging directory for
+    ``resume``.
+    """
+    staging = stage_snapshot(data_root) if snapshots else None
+    jobs = plan_targets(staging or data_root, targets, categories)
+    state = state_dir(data_root)
+    cache = ValidatorCache(state / "validators.json")
+    ledger = FetchLedger(state / "freshness.json")
+    journal = open_journal(data_root, resume)
+    resumed = len(journal) if resume else 0
+    due = Scheduler(ledger, freshness or {}).due(jobs, force=force, journal=journal if resume else None)
+    stats = scrape_jobs(due, concurrency, cache, ledger, rate, retry_policy, base_url, journal)
+    stats.skipped = len(jobs) - len(due)
+    stats.resumed = resumed
+    write_manifest(state / "manifest.json", staging or data_root, stats.changes)
+    if staging is not None and not stats.failures:
+        stats.snapshot = publish_snapshot(data_root, staging, keep=snapshots)
+    return stats
 
 
 def scrape_ga_session(
@@ -63,35 +332,30 @@ def scrape_ga_session(
     decision_label: str,
     committees: dict[str, str],
     categories: set[str],
-) -> None:
-    client = IGovClient()
-    try:
-        plenary_dir = data_root / "ga" / "plenary" / session_number
-        ensure_dir(plenary_dir)
-
-        if "meetings" in categories:
-            meetings = fetch_ga_meetings(client, session_label)
-            write_json(plenary_dir / "meetings.json", meetings)
-
-        if "agenda" in categories:
-            agenda = fetch_ga_agenda(client, session_number)
-            write_json(plenary_dir / "agenda.json", agenda)
-
-        if "documents" in categories:
-            documents = fetch_ga_documents(client, session_label)
-            write_json(plenary_dir / "documents.json", documents)
-
-        if "decisions" in categories:
-            decisions = fetch_ga_decisions(client, decision_label)
-            write_json(plenary_dir / "decisions.json", decisions)
-
-        if "proposals" in categories:
-            proposals = fetch_ga_proposals(client, session_label, "GA")
-            write_json(plenary_dir / "proposals.json", proposals)
-            for code, name in committees.items():
-                committee_dir = data_root / "ga" / code / session_number
-                ensure_dir(committee_dir)
-                committee_payload = fetch_ga_proposals(client, session_label, name)
-                write_json(committee_dir / "proposals.json", committee_payload)
-    finally:
-        client.close()
+    concurrency: int = DEFAULT_CONCURRENCY,
+    base_url: str | None = None,
+    resume: bool = False,
+    freshness: dict[str, dict[str, float]] | None = None,
+    snapshots: int = 0,
+    force: bool = False,
+    rate: float = DEFAULT_RATE,
+    retry_policy: RetryPolicy | None = None,
+) -> ScrapeStats:
+    """Scrape one GA session through ``run_scrape``; raises ``ScrapeError`` on failures."""
+    session = SessionConfig(number=session_number, label=session_label, decision_label=decision_label)
+    stats = run_scrape(
+        data_root,
+        ga_targets(session, committees),
+        categories,
+        force=force,
+        resume=resume,
+        freshness=freshness,
+        snapshots=snapshots,
+        concurrency=concurrency,
+        rate=rate,
+        retry_policy=retry_policy,
+        base_url=base_url,
+    )
+    if stats.failures:
+        raise ScrapeError(stats)
+    return stats
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from unigov.config import Config, SessionConfig
+
+CATEGORIES = ("meetings", "agenda", "documents", "decisions", "proposals")
+BODIES = ("ga", "ecosoc", "conferences")
+
+
+@dataclass(frozen=True)
+class ScrapeJob:
+    """A single API call and the file its payload is written to."""
+
+    session: str
+    committee: str
+    category: str
+    path: str
+    output: Path
+    body: str = "ga"
+    # Whether the session is still in progress, for freshness policies
+    current: bool = True
+
+
+@dataclass(frozen=True)
+class ScrapeTarget:
+    """One session of one body, written to ``data/<body>/<committee>/<session>/``."""
+
+    body: str
+    committee: str
+    session: str
+    session_label: str
+    # Value of the API's ``body`` query parameter
+    api_body: str
+    decision_label: str | None = None
+    # Committee name the proposals endpoint expects
+    proposals_name: str | None = None
+    categories: tuple[str, ...] = CATEGORIES
+    current: bool = True
+
+
+def meetings_path(session_label: str, api_body: str) -> str:
+    return f"meetings/getbysession/{session_label}?body={api_body}"
+
+
+def agenda_path(session_number: str, api_body: str) -> str:
+    # The GA agenda lookup takes no body parameter
+    if api_body == "GA":
+        return f"getlookups/getAgendas/{session_number}"
+    return f"getlookups/getAgendas/{session_number}?body={api_body}"
+
+
+def documents_path(session_label: str, api_body: str) -> str:
+    return f"meetings/getdocumentsbysession/{session_label}?body={api_body}"
+
+
+def decisions_path(decision_label: str) -> str:
+    return f"decision/getbysession/{decision_label}"
+
+
+def proposals_path(session_label: str, committee_name: str) -> str:
+    committee_value = httpx.QueryParams({"c": committee_name}).get("c")
+    return f"proposals/{session_label}/{committee_value}?env=prod"
+
+
+def ga_meetings_path(session_label: str) -> str:
+    return meetings_path(session_label, "GA")
+
+
+def ga_agenda_path(session_number: str) -> str:
+    return agenda_path(session_number, "GA")
+
+
+def ga_documents_path(session_label: str) -> str:
+    return documents_path(session_label, "GA")
+
+
+def ga_decisions_path(decision_label: str) -> str:
+    return decisions_path(decision_label)
+
+
+def ga_proposals_path(session_label: str, committee_name: str) -> str:
+    return proposals_path(session_label, committee_name)
+
+
+def target_path(target: ScrapeTarget, category: str) -> str | None:
+    """API path for ``category`` of ``target``, or None if the body does not publish it."""
+    if category == "meetings":
+        return meetings_path(target.session_label, target.api_body)
+    if category == "agenda":
+        return agenda_path(target.session, target.api_body)
+    if category == "documents":
+        return documents_path(target.session_label, target.api_body)
+    if category == "decisions" and target.decision_label:
+        return decisions_path(target.decision_label)
+    if category == "proposals" and target.proposals_name:
+        return proposals_path(target.session_label, target.proposals_name)
+    return None
+
+
+def ga_targets(session: SessionConfig, committees: dict[str, str], current: bool = True) -> list[ScrapeTarget]:
+    """The GA plenary plus the proposals of every committee.
+
+    ``committees`` may contain ``plenary`` itself, in which case its proposals
+    replace the ones fetched under the ``GA`` name, as they always have.
+    """
+    targets = [
+        ScrapeTarget(
+            "ga", "plenary", session.number, session.label, "GA",
+            decision_label=session.decision_label, proposals_name="GA", current=current,
+        )
+    ]
+    for code, name in committees.items():
+        targets.append(
+            ScrapeTarget(
+                "ga", code, session.number, session.label, "GA",
+                proposals_name=name, categories=("proposals",), current=current,
+            )
+        )
+    return targets
+
+
+def ecosoc_targets(config: Config) -> list[ScrapeTarget]:
+    """Every ECOSOC session: the Council with all categories, subsidiary bodies with meetings and documents."""
+    ecosoc = config.ecosoc
+    if ecosoc is None:
+        return []
+    targets: list[ScrapeTarget] = []
+    for session in ecosoc.sessions.values():
+        current = session.number == ecosoc.current_session
+        for code in ecosoc.bodies:
+            if code == "plenary":
+                targets.append(
+                    ScrapeTarget(
+                        "ecosoc", code, session.number, session.label, ecosoc.body_code,
+                        decision_label=session.decision_label, proposals_name=ecosoc.body_code, current=current,
+                    )
+                )
+            else:
+                targets.append(
+                    ScrapeTarget(
+                        "ecosoc", code, session.number, session.label, code.upper(),
+                        categories=("meetings", "documents"), current=current,
+                    )
+                )
+    return targets
+
+
+def conference_targets(config: Config) -> list[ScrapeTarget]:
+    """Each conference has a single session, which is treated as current."""
+    return [
+        ScrapeTarget(
+            "conferences", event.code, event.session, event.session, event.code.upper(),
+            categories=("meetings", "documents"),
+        )
+        for event in config.conferences.values()
+    ]
+
+
+def config_targets(config: Config, bodies: set[str] | None = None) -> list[ScrapeTarget]:
+    """Every configured session of every body in ``bodies`` (all bodies by default)."""
+    bodies = set(BODIES) if bodies is None else bodies
+    targets: list[ScrapeTarget] = []
+    if "ga" in bodies:
+        for session in config.ga.sessions.values():
+            targets.extend(ga_targets(session, config.ga.committees, session.number == config.ga.current_session))
+    if "ecosoc" in bodies:
+        targets.extend(ecosoc_targets(config))
+    if "conferences" in bodies:
+        targets.extend(conference_targets(config))
+    return targets
+
+
+def dedupe_jobs(jobs: list[ScrapeJob]) -> list[ScrapeJob]:
+    """Drop jobs whose output is overwritten by a later job in the list.
+
+    The blocking scraper wrote files in plan order, so the last job for a
+    given path decided its contents. Keeping only that job lets the jobs run
+    concurrently without racing on the same file.
+    """
+    last: dict[Path, ScrapeJob] = {}
+    for job in jobs:
+        last.pop(job.output, None)
+        last[job.output] = job
+    return list(last.values())
+
+
+def plan_targets(
+    data_root: Path,
+    targets: list[ScrapeTarget],
+    categories: set[str],
+    dedupe: bool = True,
+) -> list[ScrapeJob]:
+    """Expand ``targets`` into one job per endpoint, in target order."""
+    jobs: list[ScrapeJob] = []
+    for target in targets:
+        output_dir = data_root / target.body / target.committee / target.session
+        for category in target.categories:
+            if category not in categories:
+                continue
+            path = target_path(target, category)
+            if path is None:
+                continue
+            jobs.append(
+                ScrapeJob(
+                    target.session,
+                    target.committee,
+                    category,
+                    path,
+                    output_dir / f"{category}.json",
+                    body=target.body,
+                    current=target.current,
+                )
+            )
+    return dedupe_jobs(jobs) if dedupe else jobs
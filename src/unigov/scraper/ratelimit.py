@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from unigov.scraper.stats import ScrapeStats
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+
+class TokenBucket:
+    """Token bucket whose refill rate adapts to how the server responds.
+
+    Successes raise the rate additively up to ``max_rate``; throttling and
+    server errors cut it multiplicatively. A ``Retry-After`` pauses every
+    caller sharing the bucket until the server says to come back.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        min_rate: float = 0.5,
+        max_rate: float | None = None,
+    ) -> None:
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max(1, int(rate)))
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(wait, self._blocked_until - now)
+
+    def on_success(self) -> None:
+        self.rate = min(self.max_rate, self.rate + 0.1)
+
+    def on_failure(self, throttled: bool, retry_after: float | None = None) -> None:
+        self.rate = max(self.min_rate, self.rate * (0.5 if throttled else 0.8))
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given zero-based retry."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestGovernor:
+    """Rate limiting and retry decisions shared by the sync and async clients."""
+
+    def __init__(self, limiter: TokenBucket, policy: RetryPolicy, stats: ScrapeStats) -> None:
+        self.limiter = limiter
+        self.policy = policy
+        self.stats = stats
+
+    def wait(self) -> float:
+        return self.limiter.reserve()
+
+    def retry_delay(
+        self,
+        path: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: httpx.TransportError | None = None,
+    ) -> float | None:
+        """Seconds to back off before retrying, or ``None`` if ``response`` is final.
+
+        Transport errors are re-raised once the retry budget is spent; a
+        retryable status is returned as final so the caller raises it.
+        """
+        if response is not None and response.status_code not in RETRY_STATUSES:
+            self.limiter.on_success()
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        throttled = response is not None and response.status_code in THROTTLE_STATUSES
+        self.limiter.on_failure(throttled, retry_after)
+
+        if attempt >= self.policy.attempts:
+            if error is not None:
+                raise error
+            return None
+
+        delay = max(self.policy.backoff(attempt), retry_after or 0.0)
+        self.stats.record_retry(path, delay)
+        return delay
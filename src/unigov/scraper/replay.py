@@ -0,0 +1,161 @@
+"""Local stand-in for the iGov API, replaying the fixtures under ``data/``.
+
+Used to benchmark and regression-test the scraper offline. Every endpoint
+the scrape plan requests is served from the file it would be written to.
+Latency, bandwidth and error injection are configurable.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+from unigov.config import Config
+from unigov.scraper.plan import CATEGORIES, config_targets, plan_targets
+from unigov.snapshot import resolve_data_dir
+
+API_PREFIX = "/igov/api/"
+EMPTY_PROPOSALS = {"message": "Success", "success": True, "result": []}
+
+
+@dataclass(frozen=True)
+class ReplayOptions:
+    latency: float = 0.0
+    # Bytes per second; 0 disables throttling
+    bandwidth: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (429, 500, 503)
+    retry_after: int = 1
+
+
+@dataclass(frozen=True)
+class Fixture:
+    body: bytes
+    etag: str
+    last_modified: float
+
+
+class FixtureStore:
+    """API path -> fixture file, with bodies encoded lazily and then kept in memory."""
+
+    def __init__(self, routes: dict[str, tuple[str, Path]]) -> None:
+        self.routes = routes
+        self._fixtures: dict[str, Fixture] = {}
+        self._lock = threading.Lock()
+
+    def get(self, api_path: str) -> Fixture | None:
+        if api_path not in self.routes:
+            return None
+        with self._lock:
+            fixture = self._fixtures.get(api_path)
+            if fixture is None:
+                fixture = self._load(*self.routes[api_path])
+                self._fixtures[api_path] = fixture
+        return fixture
+
+    @staticmethod
+    def _load(category: str, path: Path) -> Fixture:
+        if path.exists():
+            payload = json.loads(path.read_text())
+            mtime = path.stat().st_mtime
+        else:
+            payload = EMPTY_PROPOSALS if category == "proposals" else []
+            mtime = 0.0
+        body = json.dumps(payload).encode("utf-8")
+        return Fixture(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"', last_modified=mtime)
+
+
+def fixture_routes(config: Config) -> dict[str, tuple[str, Path]]:
+    routes: dict[str, tuple[str, Path]] = {}
+    for job in plan_targets(resolve_data_dir(config.site.data_dir), config_targets(config), set(CATEGORIES), dedupe=False):
+        routes[job.path] = (job.category, job.output)
+    return routes
+
+
+def make_handler(store: FixtureStore, options: ReplayOptions) -> type[BaseHTTPRequestHandler]:
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            if options.latency:
+                time.sleep(options.latency)
+            if options.error_rate and random.random() < options.error_rate:
+                self._send_error(random.choice(options.error_statuses))
+                return
+
+            api_path = unquote(self.path)
+            fixture = store.get(api_path[len(API_PREFIX):]) if api_path.startswith(API_PREFIX) else None
+            if fixture is None:
+                self._send_error(404)
+                return
+
+            if self._not_modified(fixture):
+                self.send_response(304)
+                self._send_validators(fixture)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(fixture.body)))
+            self._send_validators(fixture)
+            self.end_headers()
+            self._write_body(fixture.body)
+
+        def _not_modified(self, fixture: Fixture) -> bool:
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match is not None:
+                return if_none_match == fixture.etag
+            if_modified_since = self.headers.get("If-Modified-Since")
+            if if_modified_since:
+                try:
+                    return parsedate_to_datetime(if_modified_since).timestamp() >= int(fixture.last_modified)
+                except (TypeError, ValueError):
+                    return False
+            return False
+
+        def _send_validators(self, fixture: Fixture) -> None:
+            self.send_header("ETag", fixture.etag)
+            self.send_header("Last-Modified", formatdate(fixture.last_modified, usegmt=True))
+
+        def _send_error(self, status: int) -> None:
+            self.send_response(status)
+            if status in (429, 503):
+                self.send_header("Retry-After", str(options.retry_after))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def _write_body(self, body: bytes) -> None:
+            if not options.bandwidth:
+                self.wfile.write(body)
+                return
+            chunk_size = max(1024, int(options.bandwidth / 20))
+            for start in range(0, len(body), chunk_size):
+                chunk = body[start:start + chunk_size]
+                self.wfile.write(chunk)
+                time.sleep(len(chunk) / options.bandwidth)
+
+    return ReplayHandler
+
+
+def make_server(config: Config, host: str, port: int, options: ReplayOptions) -> ThreadingHTTPServer:
+    store = FixtureStore(fixture_routes(config))
+    server = ThreadingHTTPServer((host, port), make_handler(store, options))
+    server.daemon_threads = True
+    return server
+
+
+def server_api_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}{API_PREFIX.rstrip('/')}"
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from unigov.scraper.plan import ScrapeJob
+
+
+def job_key(job: ScrapeJob) -> str:
+    return f"{job.body}/{job.session}/{job.committee}/{job.category}"
+
+
+class FetchLedger:
+    """Time of the last successful fetch for each (body, session, committee, category)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, str] = {}
+        if path.exists():
+            self._entries = json.loads(path.read_text())
+
+    def last_fetched(self, job: ScrapeJob) -> datetime | None:
+        value = self._entries.get(job_key(job))
+        return datetime.fromisoformat(value) if value else None
+
+    def record(self, job: ScrapeJob, when: datetime | None = None) -> None:
+        when = when or datetime.now(timezone.utc)
+        self._entries[job_key(job)] = when.isoformat(timespec="seconds")
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(dict(sorted(self._entries.items())), indent=2))
+
+
+class CheckpointJournal:
+    """Append-only journal of the units completed by an unfinished scrape.
+
+    Every completed job is appended and flushed to disk immediately, so the
+    progress of a run that crashes or is killed survives it. A run that
+    finishes without failures clears the journal.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._completed: dict[str, datetime] = {}
+        if path.exists():
+            for line in path.read_text().splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by the interruption
+                    continue
+                self._completed[entry["unit"]] = datetime.fromisoformat(entry["time"])
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def completed_at(self, job: ScrapeJob) -> datetime | None:
+        return self._completed.get(job_key(job))
+
+    def record(self, job: ScrapeJob, when: datetime | None = None) -> None:
+        when = when or datetime.now(timezone.utc)
+        self._completed[job_key(job)] = when
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps({"unit": job_key(job), "time": when.isoformat(timespec="seconds")}) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def clear(self) -> None:
+        self._completed.clear()
+        self.path.unlink(missing_ok=True)
+
+
+class Scheduler:
+    """Select the jobs whose data is older than its freshness policy allows.
+
+    ``freshness`` maps ``"current"`` and ``"closed"`` to per-category maximum
+    ages in seconds, with ``"default"`` as the fallback. Which policy applies
+    is decided by the job's ``current`` flag. A category without any policy
+    is always considered stale.
+    """
+
+    def __init__(
+        self,
+        ledger: FetchLedger,
+        freshness: dict[str, dict[str, float]],
+        now: datetime | None = None,
+    ) -> None:
+        self.ledger = ledger
+        self.freshness = freshness
+        self.now = now or datetime.now(timezone.utc)
+
+    def max_age(self, job: ScrapeJob) -> float:
+        policies = self.freshness.get("current" if job.current else "closed") or {}
+        return policies.get(job.category, policies.get("default", 0.0))
+
+    def is_stale(self, job: ScrapeJob) -> bool:
+        if not job.output.exists():
+            return True
+        last = self.ledger.last_fetched(job)
+        if last is None:
+            return True
+        return (self.now - last).total_seconds() >= self.max_age(job)
+
+    def is_checkpointed(self, job: ScrapeJob, journal: CheckpointJournal) -> bool:
+        """Whether an interrupted run already fetched ``job`` and its payload is still fresh."""
+        if not job.output.exists():
+            return False
+        completed = journal.completed_at(job)
+        if completed is None:
+            return False
+        return (self.now - completed).total_seconds() < self.max_age(job)
+
+    def due(
+        self,
+        jobs: list[ScrapeJob],
+        force: bool = False,
+        journal: CheckpointJournal | None = None,
+    ) -> list[ScrapeJob]:
+        """Jobs to fetch; with a ``journal``, units an interrupted run completed are skipped even when forced."""
+        if journal is not None:
+            jobs = [job for job in jobs if not self.is_checkpointed(job, journal)]
+        if force:
+            return list(jobs)
+        return [job for job in jobs if self.is_stale(job)]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from unigov.scraper.storage import FileChange
+
+
+@dataclass
+class ScrapeStats:
+    requests: int = 0
+    downloaded_bytes: int = 0
+    not_modified: int = 0
+    avoided_bytes: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    # Keyed by API path
+    retries: dict[str, int] = field(default_factory=dict)
+    backoff_seconds: dict[str, float] = field(default_factory=dict)
+    failures: dict[str, str] = field(default_factory=dict)
+    changes: list[FileChange] = field(default_factory=list)
+    identical_writes: int = 0
+    # Units skipped because an interrupted run had completed them
+    resumed: int = 0
+    # Snapshot the run published, when snapshots are in use
+    snapshot: Path | None = None
+
+    def record_retry(self, path: str, delay: float) -> None:
+        self.retries[path] = self.retries.get(path, 0) + 1
+        self.backoff_seconds[path] = self.backoff_seconds.get(path, 0.0) + delay
+
+    def summary(self) -> str:
+        return (
+            f"{self.skipped} fresh units skipped; "
+            f"{self.requests} requests, {format_bytes(self.downloaded_bytes)} downloaded; "
+            f"{self.not_modified} not modified ({format_bytes(self.avoided_bytes)} avoided), "
+            f"{self.unchanged} unchanged bodies not rewritten; "
+            f"{len(self.changes)} files changed, {self.identical_writes} identical; "
+            f"{sum(self.retries.values())} retries, {sum(self.backoff_seconds.values()):.1f}s backoff"
+        )
+
+    def retry_report(self) -> list[str]:
+        return [
+            f"{path}: {count} retries, {self.backoff_seconds.get(path, 0.0):.1f}s backoff"
+            for path, count in sorted(self.retries.items())
+        ]
+
+
+def format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class FileChange:
+    path: Path
+    old_hash: str | None
+    new_hash: str
+
+
+def canonical_json(payload: Any) -> bytes:
+    """Serialise ``payload`` exactly as it is stored under ``data/``."""
+    return json.dumps(payload, indent=2, ensure_ascii=True).encode("ascii")
+
+
+def file_hash(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to a temporary sibling and rename it over ``path``.
+
+    Readers see either the previous file or the complete new one, never a
+    partial write.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def read_bytes(path: Path) -> bytes | None:
+    return path.read_bytes() if path.exists() else None
+
+
+def write_json(path: Path, payload: Any, current: bytes | None = None) -> FileChange | None:
+    """Atomically write ``payload`` unless the file already holds the same bytes.
+
+    ``current`` may carry the file's existing contents when the caller has
+    already read them.
+    """
+    data = canonical_json(payload)
+    new_hash = hashlib.sha256(data).hexdigest()
+    old_hash = hashlib.sha256(current).hexdigest() if current is not None else file_hash(path)
+    if old_hash == new_hash:
+        return None
+    atomic_write_bytes(path, data)
+    return FileChange(path=path, old_hash=old_hash, new_hash=new_hash)
+
+
+def write_manifest(manifest_path: Path, root: Path, changes: list[FileChange]) -> None:
+    """Record the files changed by a scrape run, relative to ``root``."""
+    manifest = {
+        "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "changed": [
+            {"path": change.path.relative_to(root).as_posix(), "old": change.old_hash, "new": change.new_hash}
+            for change in sorted(changes, key=lambda change: change.path)
+        ],
+    }
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
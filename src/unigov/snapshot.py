@@ -0,0 +1,104 @@
+"""Snapshot-isolated data directories.
+
+When snapshots are enabled, the scraper fills ``data/snapshots/.staging``
+and publishes it as ``data/snapshots/<id>`` by atomically rewriting the
+``data/CURRENT`` pointer. Readers resolve the pointer once and keep using
+that snapshot, so a build never sees a half-finished scrape.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+from unigov.scraper.storage import atomic_write_bytes
+
+POINTER_NAME = "CURRENT"
+SNAPSHOTS_DIR = "snapshots"
+STAGING_NAME = ".staging"
+# The snapshot being replaced is always kept, so a build that pinned it
+# just before the swap can finish
+MIN_KEEP = 2
+
+
+def current_snapshot(data_root: Path) -> Path | None:
+    pointer = data_root / POINTER_NAME
+    if not pointer.exists():
+        return None
+    snapshot = data_root / SNAPSHOTS_DIR / pointer.read_text().strip()
+    return snapshot if snapshot.is_dir() else None
+
+
+def resolve_data_dir(data_root: Path) -> Path:
+    """The published snapshot, or ``data_root`` itself when snapshots are not in use."""
+    return current_snapshot(data_root) or data_root
+
+
+def link_tree(source: Path, target: Path) -> None:
+    """Mirror ``source`` into ``target`` with hard links.
+
+    JSON payloads are only ever replaced by rename, so sharing their inodes
+    with the source is safe. Append-only files such as ``changes.jsonl``
+    are copied instead.
+    """
+    def link(src: str, dst: str) -> None:
+        if src.endswith(".json"):
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass
+        shutil.copy2(src, dst)
+
+    shutil.copytree(source, target, copy_function=link, dirs_exist_ok=True)
+
+
+def stage_snapshot(data_root: Path) -> Path:
+    """Staging directory for the next snapshot, seeded from the current data.
+
+    A staging directory left behind by an interrupted scrape is reused, so
+    the work it holds is published by the next run.
+    """
+    snapshots = data_root / SNAPSHOTS_DIR
+    staging = snapshots / STAGING_NAME
+    if staging.exists():
+        return staging
+
+    seeding = snapshots / f"{STAGING_NAME}.tmp"
+    if seeding.exists():
+        shutil.rmtree(seeding)
+    seeding.mkdir(parents=True)
+    source = current_snapshot(data_root)
+    if source is not None:
+        link_tree(source, seeding)
+    else:
+        for child in sorted(data_root.iterdir()):
+            if child.is_dir() and not child.name.startswith(".") and child.name != SNAPSHOTS_DIR:
+                link_tree(child, seeding / child.name)
+    os.rename(seeding, staging)
+    return staging
+
+
+def publish_snapshot(data_root: Path, staging: Path, keep: int) -> Path:
+    """Move ``staging`` into place, swap the pointer to it and prune old snapshots.
+
+    The ``keep`` most recent snapshots are retained, and never fewer than
+    ``MIN_KEEP``, so builds that pinned one of them shortly before the swap
+    can still finish. A build that outlasts ``keep - 1`` later publishes may
+    lose its snapshot.
+    """
+    snapshots = data_root / SNAPSHOTS_DIR
+    name = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    snapshot = snapshots / name
+    suffix = 1
+    while snapshot.exists():
+        suffix += 1
+        snapshot = snapshots / f"{name}-{suffix}"
+    os.rename(staging, snapshot)
+    atomic_write_bytes(data_root / POINTER_NAME, f"{snapshot.name}\n".encode("ascii"))
+
+    published = sorted(path for path in snapshots.iterdir() if path.is_dir() and not path.name.startswith("."))
+    for old in published[: max(0, len(published) - max(MIN_KEEP, keep))]:
+        shutil.rmtree(old, ignore_errors=True)
+    return snapshot
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner, Result
+
+from unigov.cli import cli
+
+CONFIG = """\
+site:
+  title: "iGov"
+  base_url: "/"
+  output_dir: "output"
+  data_dir: "data"
+  cache_dir: ".cache"
+
+ga:
+  body_code: "GA"
+  label: "General Assembly"
+  sessions:
+    "80":
+      label: "EIGHTIETH"
+      decision_label: "80th session of the General Assembly"
+  committees:
+    plenary: "Plenary"
+"""
+
+
+def meeting(name: str, start: str, steps: list[dict] | None = None) -> dict:
+    return {
+        "MT_name": name,
+        "MT_dateTimeScheduleStart": start,
+        "MT_dateTimeScheduleEnd": start,
+        "MT_commentary": None,
+        "MT_segment": [{"MTS_segmentTitle": "Agenda item 1"}],
+        "procedureStep": steps or [],
+    }
+
+
+def adoption_step(symbol: str) -> dict:
+    return {
+        "PS_type_label": "Action (numbered resolution)",
+        "seqNo": "1.01",
+        "PS_selectDocumentFromWorkPackage": [{"DD_symbol1": symbol}],
+        "PS_voting": "Yes",
+        "PS_InFavor": 120,
+        "PS_against": 3,
+        "PS_recordResolutionNumber": "80/1",
+    }
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Path:
+    """A one-session site; returns its config path."""
+    config = tmp_path / "config.yaml"
+    config.write_text(CONFIG)
+    write_meetings(config, [meeting("Plenary meeting 1", "2025-09-09T10:00:00", [adoption_step("A/80/L.1")])])
+    return config
+
+
+def write_meetings(config: Path, meetings: list[dict]) -> None:
+    data_dir = config.parent / "data" / "ga" / "plenary" / "80"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "meetings.json").write_text(json.dumps(meetings))
+
+
+def build(config: Path, *args: str) -> Result:
+    result = CliRunner().invoke(cli, ["build", "--config", str(config), "--session", "80", *args])
+    assert result.exit_code == 0, result.output
+    return result
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from conftest import build
+
+OTHER_BODIES = """
+ecosoc:
+  body_code: "ECOSOC"
+  label: "Economic and Social Council"
+  sessions:
+    "2027":
+      label: "2027"
+      decision_label: "2027 session of the Economic and Social Council"
+  bodies:
+    plenary: "Plenary"
+    csw: "Commission on the Status of Women"
+
+conferences:
+  label: "Conferences"
+  events:
+    ffd5:
+      code: "ffd5"
+      label: "Fifth International Conference on Financing for Development"
+      session: "2029"
+"""
+
+
+def test_other_bodies_follow_the_config(site: Path) -> None:
+    site.write_text(site.read_text() + OTHER_BODIES)
+    build(site)
+    output = site.parent / "output"
+    built = sorted(path.parent.relative_to(output).as_posix() for path in output.glob("*/*/*/index.html"))
+    assert [path for path in built if not path.startswith("ga/")] == [
+        "conferences/ffd5/2029",
+        "ecosoc/csw/2027",
+        "ecosoc/plenary/2027",
+    ]
+    assert "Fifth International Conference on Financing for Development" in (output / "conferences/ffd5/2029/index.html").read_text()
+
+
+def test_proposals_index_ignores_file_times(site: Path) -> None:
+    committee = site.parent / "data" / "ga" / "c6" / "80"
+    committee.mkdir(parents=True)
+    proposals = committee / "proposals.json"
+    proposals.write_text(json.dumps({"result": [{"PR_Title": "New", "PR_Stage": [{"DocSymbol": "A/C.6/80/L.1 DR 1"}]}]}))
+    assert "1 proposals files indexed, 1 re-read" in " ".join(build(site).output.split())
+    os.utime(proposals, (0, 0))
+    assert "1 proposals files indexed, 0 re-read" in " ".join(build(site).output.split())
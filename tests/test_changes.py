@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from unigov.scraper.changes import diff_records
+
+
+def test_changed_records_carry_only_changed_values() -> None:
+    old = [{"ED_DecisionNumber": "80/501", "ED_Title": "Old", "ED_Body": "long text"}]
+    new = [{"ED_DecisionNumber": "80/501", "ED_Title": "New", "ED_Body": "long text"}]
+    assert diff_records("decisions", old, new) == [
+        {"op": "changed", "id": "80/501", "fields": ["ED_Title"], "values": {"ED_Title": "New"}}
+    ]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+from conftest import adoption_step, build, meeting, write_meetings
+
+
+def site_files(output: Path) -> dict[str, bytes]:
+    return {path.relative_to(output).as_posix(): path.read_bytes() for path in sorted(output.rglob("*")) if path.is_file()}
+
+
+def test_parallel_build_matches_serial_with_colliding_meetings(site: Path) -> None:
+    # Same name and start hour, so both meetings map to one folder
+    write_meetings(
+        site,
+        [
+            meeting("Plenary meeting 1", "2025-09-09T10:00:00", [adoption_step("A/80/L.1")]),
+            meeting("Plenary meeting 1", "2025-09-09T10:30:00", [adoption_step("A/80/L.2")]),
+        ],
+    )
+    output = site.parent / "output"
+
+    build(site)
+    serial = site_files(output)
+    page = output / "ga" / "plenary" / "80" / "25090910-plenary-meeting-1" / "index.html"
+    assert "L.2" in page.read_text()
+
+    shutil.rmtree(output)
+    shutil.rmtree(site.parent / ".cache")
+    build(site, "-j", "2")
+    assert site_files(output) == serial
+
+    rebuilt = build(site, "-j", "2")
+    assert "0 pages rendered" in rebuilt.output
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from conftest import build
+
+from unigov.generator import renderer, step_engine
+
+
+@pytest.fixture
+def rules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A copy of ``procedure_steps.yaml`` that the build loads instead."""
+    path = tmp_path / "procedure_steps.yaml"
+    path.write_text(renderer.get_templates_path().read_text())
+    monkeypatch.setattr(renderer, "get_templates_path", lambda: path)
+    monkeypatch.setattr(renderer, "_templates_cache", None)
+    monkeypatch.setattr(step_engine, "_engine", None)
+    return path
+
+
+def test_editing_step_rules_rebuilds_meeting_pages(site: Path, rules: Path) -> None:
+    page = site.parent / "output" / "ga" / "plenary" / "80" / "25090910-plenary-meeting-1" / "index.html"
+    build(site)
+    assert "Draft resolution L.1 was adopted by 120 to 3" in page.read_text()
+
+    unchanged = build(site)
+    assert "0 pages rendered" in unchanged.output
+
+    rules.write_text(rules.read_text().replace("was adopted by {in_favor}", "was carried by {in_favor}"))
+    renderer._templates_cache = None
+    step_engine._engine = None
+    build(site)
+    assert "Draft resolution L.1 was carried by 120 to 3" in page.read_text()
+
+
+def test_unrelated_proposals_leave_meeting_pages_alone(site: Path) -> None:
+    build(site)
+    committee = site.parent / "data" / "ga" / "c6" / "80"
+    committee.mkdir(parents=True)
+    (committee / "proposals.json").write_text(json.dumps({"result": [{"_id": "p1", "PR_Title": "New", "PR_Stage": [{"DocSymbol": "A/C.6/80/L.1 DR 1", "VotesAdd": [{"PSID": 9}]}]}]}))
+    rebuilt = build(site)
+    assert "0 pages rendered" in rebuilt.output
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from unigov.config import SessionConfig
+from unigov.scraper import igov
+from unigov.scraper.igov import run_scrape
+from unigov.scraper.plan import ga_targets
+from unigov.scraper.stats import ScrapeStats
+from unigov.snapshot import current_snapshot
+
+TARGETS = ga_targets(SessionConfig("80", "EIGHTIETH", "80th session of the General Assembly"), {})
+
+
+class Api(BaseHTTPRequestHandler):
+    # Path fragment answered with 404 instead of an empty list
+    failing: str | None = None
+
+    def do_GET(self) -> None:
+        if self.failing is not None and self.failing in self.path:
+            self.send_error(404)
+            return
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def api() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Api)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        Api.failing = None
+
+
+def scrape(data_root: Path, api: str, resume: bool = False) -> ScrapeStats:
+    return run_scrape(
+        data_root,
+        TARGETS,
+        {"meetings", "agenda"},
+        force=True,
+        resume=resume,
+        freshness={"current": {"default": 3600}},
+        snapshots=1,
+        rate=1000,
+        base_url=api,
+    )
+
+
+def test_failed_scrape_keeps_current_snapshot_and_staging(tmp_path: Path, api: str) -> None:
+    data_root = tmp_path / "data"
+    data_root.mkdir()
+    published = scrape(data_root, api).snapshot
+    assert published is not None and current_snapshot(data_root) == published
+
+    Api.failing = "getAgendas"
+    failed = scrape(data_root, api)
+    assert failed.failures and failed.snapshot is None
+    assert current_snapshot(data_root) == published
+    assert published.exists()
+    assert (data_root / "snapshots" / ".staging").exists()
+
+    Api.failing = None
+    resumed = scrape(data_root, api, resume=True)
+    assert resumed.resumed == 1 and resumed.requests == 1
+    assert resumed.snapshot is not None and current_snapshot(data_root) == resumed.snapshot
+    assert not (data_root / "snapshots" / ".staging").exists()
+    # The replaced snapshot survives even with ``snapshots: 1``
+    assert published.exists()
+
+
+def test_failed_write_records_no_validators(tmp_path: Path, api: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    def full_disk(*args: object, **kwargs: object) -> None:
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(igov, "write_json", full_disk)
+    with pytest.raises(OSError):
+        run_scrape(tmp_path, TARGETS, {"meetings"}, force=True, rate=1000, base_url=api)
+    assert json.loads((tmp_path / ".scrape" / "validators.json").read_text()) == {}